@@ -0,0 +1,242 @@
+"""
+Fused per-pixel blend kernels for the layer compositor.
+
+Each kernel reads the two uint8 RGBA images once and writes the uint8
+result once, fusing the blend-mode math, opacity and the alpha composite
+instead of building a dozen full-size float temporaries. Requires numba;
+without it blend_kernel_for returns None and the compositor keeps its NumPy
+paths.
+"""
+
+from __future__ import annotations
+
+import functools
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+# Kernel mode ids, keyed by BlendMode value, handled by _blend_pixel
+MODE_IDS = {
+    "multiply": 1,
+    "screen": 2,
+    "overlay": 3,
+    "soft_light": 4,
+    "hard_light": 5,
+    "color_dodge": 6,
+    "color_burn": 7,
+    "darken": 8,
+    "lighten": 9,
+    "difference": 10,
+    "exclusion": 11,
+}
+
+# Component-swap modes, handled by _blend_hsl_pixel
+HSL_MODE_IDS = {
+    "hue": 1,
+    "saturation": 2,
+    "color": 3,
+    "luminosity": 4,
+}
+
+if njit is not None:
+
+    @njit(inline="always")
+    def _blend_channel(b, o, mode_id):
+        """Blend one channel; b and o are in 0.0 - 1.0."""
+        if mode_id == 1:
+            return b * o
+        if mode_id == 2:
+            return 1.0 - (1.0 - b) * (1.0 - o)
+        if mode_id == 3:
+            if b < 0.5:
+                return 2.0 * b * o
+            return 1.0 - 2.0 * (1.0 - b) * (1.0 - o)
+        if mode_id == 4:
+            if o < 0.5:
+                return 2.0 * b * o + b * b * (1.0 - 2.0 * o)
+            return 2.0 * b * (1.0 - o) + b**0.5 * (2.0 * o - 1.0)
+        if mode_id == 5:
+            if o < 0.5:
+                return 2.0 * b * o
+            return 1.0 - 2.0 * (1.0 - b) * (1.0 - o)
+        if mode_id == 6:
+            if o >= 1.0:
+                return 1.0
+            return min(1.0, b / (1.0 - o + 1e-10))
+        if mode_id == 7:
+            if o <= 0.0:
+                return 0.0
+            return 1.0 - min(1.0, (1.0 - b) / (o + 1e-10))
+        if mode_id == 8:
+            return min(b, o)
+        if mode_id == 9:
+            return max(b, o)
+        if mode_id == 10:
+            return abs(b - o)
+        if mode_id == 11:
+            return b + o - 2.0 * b * o
+        return o
+
+    @njit(inline="always")
+    def _to_byte(v):
+        """Round a 0.0 - 1.0 value to a clipped uint8 level."""
+        level = int(v * 255.0 + 0.5)
+        return min(255, max(0, level))
+
+    @njit(inline="always")
+    def _opacity_weight(opacity):
+        """Opacity as the /256 fixed-point weight the NumPy paths scale alpha by."""
+        return int(round(min(1.0, max(0.0, opacity)) * 256.0))
+
+    @njit(inline="always")
+    def _composite(v, b, oa, ba, out_a):
+        """Blended value v over base value b, weighted by the two alphas."""
+        return (v * oa + b * ba * (1.0 - oa)) / out_a
+
+    @njit(inline="always")
+    def _blend_pixel(base, overlay, out, y, x, mode_id, weight):
+        """
+        Blend one pixel of overlay onto base into out.
+
+        The overlay's alpha is first scaled by the opacity weight. The
+        blended color is then composited over base by that alpha, and alpha
+        is overlay-over-base.
+        """
+        inv = 1.0 / 255.0
+        oa = ((overlay[y, x, 3] * weight) >> 8) * inv
+        ba = base[y, x, 3] * inv
+        out_a = oa + ba * (1.0 - oa)
+        if oa > 0.0:
+            for c in range(3):
+                b = base[y, x, c] * inv
+                v = _blend_channel(b, overlay[y, x, c] * inv, mode_id)
+                out[y, x, c] = _to_byte(_composite(v, b, oa, ba, out_a))
+        else:
+            for c in range(3):
+                out[y, x, c] = base[y, x, c]
+        out[y, x, 3] = _to_byte(out_a)
+
+    @njit(inline="always")
+    def _rgb_to_hsv(r, g, b):
+        """One pixel of matplotlib.colors.rgb_to_hsv."""
+        v = max(r, g, b)
+        delta = v - min(r, g, b)
+        if delta <= 0.0:
+            return 0.0, 0.0, v
+        if b == v:
+            h = 4.0 + (r - g) / delta
+        elif g == v:
+            h = 2.0 + (b - r) / delta
+        else:
+            h = (g - b) / delta
+        return (h / 6.0) % 1.0, delta / v, v
+
+    @njit(inline="always")
+    def _hsv_to_rgb(h, s, v):
+        """One pixel of matplotlib.colors.hsv_to_rgb."""
+        if s <= 0.0:
+            return v, v, v
+        i = int(h * 6.0)
+        f = h * 6.0 - i
+        p = v * (1.0 - s)
+        q = v * (1.0 - s * f)
+        t = v * (1.0 - s * (1.0 - f))
+        i = i % 6
+        if i == 0:
+            return v, t, p
+        if i == 1:
+            return q, v, p
+        if i == 2:
+            return p, v, t
+        if i == 3:
+            return p, q, v
+        if i == 4:
+            return t, p, v
+        return v, p, q
+
+    @njit(inline="always")
+    def _blend_hsl_pixel(base, overlay, out, y, x, mode_id, weight):
+        """
+        _blend_pixel for the HSL_MODE_IDS modes.
+
+        Swaps hue, saturation or value between the two pixels in place of
+        converting both whole images to HSV and back; same results as the
+        matplotlib round trip.
+        """
+        inv = 1.0 / 255.0
+        oa = ((overlay[y, x, 3] * weight) >> 8) * inv
+        ba = base[y, x, 3] * inv
+        out_a = oa + ba * (1.0 - oa)
+        if oa > 0.0:
+            br = base[y, x, 0] * inv
+            bg = base[y, x, 1] * inv
+            bb = base[y, x, 2] * inv
+            bh, bs, bv = _rgb_to_hsv(br, bg, bb)
+            oh, os_, ov = _rgb_to_hsv(
+                overlay[y, x, 0] * inv,
+                overlay[y, x, 1] * inv,
+                overlay[y, x, 2] * inv,
+            )
+            if mode_id == 1:
+                bh = oh
+            elif mode_id == 2:
+                bs = os_
+            elif mode_id == 3:
+                bh = oh
+                bs = os_
+            else:
+                bv = ov
+            r, g, b = _hsv_to_rgb(bh, bs, bv)
+            out[y, x, 0] = _to_byte(_composite(r, br, oa, ba, out_a))
+            out[y, x, 1] = _to_byte(_composite(g, bg, oa, ba, out_a))
+            out[y, x, 2] = _to_byte(_composite(b, bb, oa, ba, out_a))
+        else:
+            for c in range(3):
+                out[y, x, c] = base[y, x, c]
+        out[y, x, 3] = _to_byte(out_a)
+
+    @functools.lru_cache(maxsize=len(MODE_IDS) + len(HSL_MODE_IDS))
+    def blend_kernel_for(mode: str):
+        """
+        Kernel blend(base, overlay, out, opacity) specialized to one blend
+        mode, compiled on first use (and cached on disk by numba), or None
+        for modes without a kernel.
+
+        base, overlay and out are (h, w, 4) uint8. The mode id is a
+        closure constant, so numba folds the per-pixel mode dispatch away.
+        """
+        if mode in MODE_IDS:
+            blend_pixel, mode_id = _blend_pixel, MODE_IDS[mode]
+        elif mode in HSL_MODE_IDS:
+            blend_pixel, mode_id = _blend_hsl_pixel, HSL_MODE_IDS[mode]
+        else:
+            return None
+
+        @njit(parallel=True, cache=True, fastmath=True)
+        def blend(base, overlay, out, opacity):
+            height, width = base.shape[0], base.shape[1]
+            weight = _opacity_weight(opacity)
+            for y in prange(height):
+                for x in range(width):
+                    blend_pixel(base, overlay, out, y, x, mode_id, weight)
+
+        return blend
+
+else:
+
+    def blend_kernel_for(mode: str):
+        """Without numba there are no kernels."""
+        return None
+
+
+def warm_blend_kernels(modes):
+    """Compile (or load from numba's cache) the kernels for modes now."""
+    tile = np.zeros((2, 2, 4), dtype=np.uint8)
+    for mode in modes:
+        kernel = blend_kernel_for(mode)
+        if kernel is not None:
+            kernel(tile, tile, np.empty_like(tile), 1.0)
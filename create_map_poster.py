@@ -1,8 +1,13 @@
 import argparse
+import copy
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import functools
+import hashlib
 import json
 from PIL import Image, PngImagePlugin
 
 import logging_config
+import multiprocessing
 import os
 import pickle
 import sys
@@ -10,6 +15,7 @@ import time
 from datetime import datetime
 from map_providers.maritime import fetch_maritime_features, fetch_coastline
 from map_providers.aviation import fetch_aviation_features
+from map_providers.async_fetch import fetch_concurrently
 from map_providers.starmap import calculate_star_positions
 
 # Note: map_providers.railway and cycling contain alternative implementations
@@ -38,6 +44,21 @@ try:
 except ImportError:
     GeoDataFrame = None
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Theme files are parsed with orjson when available
+_loads = orjson.loads if orjson else json.loads
+
+try:
+    import datashader as ds
+    import datashader.transfer_functions as tf
+except ImportError:
+    ds = None
+    tf = None
+
 logger = logging_config.logger
 
 # Additional map provider flags
@@ -55,6 +76,11 @@ CACHE_DIR = Path(CACHE_DIR_PATH)
 CACHE_DIR.mkdir(exist_ok=True)
 
 
+# Line layers with at least this many features are rasterized with datashader
+# (when installed) instead of being drawn path-by-path through matplotlib.
+DATASHADER_MIN_FEATURES = 5000
+RASTER_FORMATS = {"png", "jpg", "jpeg", "tiff", "webp"}
+
 THEMES_DIR = "themes"
 FONTS_DIR = "assets/fonts"
 POSTERS_DIR = "outputs"
@@ -132,12 +158,35 @@ def get_available_themes():
         os.makedirs(THEMES_DIR)
         return []
 
-    themes = []
-    for file in sorted(os.listdir(THEMES_DIR)):
-        if file.endswith(".json"):
-            theme_name = file[:-5]  # Remove .json extension
-            themes.append(theme_name)
-    return themes
+    # DirEntry.is_file() uses the type scandir already read, no extra stat
+    with os.scandir(THEMES_DIR) as it:
+        return sorted(
+            e.name[:-5]  # Remove .json extension
+            for e in it
+            if e.name.endswith(".json") and e.is_file()
+        )
+
+
+@functools.lru_cache(maxsize=None)
+def available_themes_cached():
+    """
+    get_available_themes() scanned once per process. Returned as a tuple so
+    it is immutable and hashable for other lru_cache keys.
+    """
+    return tuple(get_available_themes())
+
+
+@functools.lru_cache(maxsize=1)
+def get_color_enhancer():
+    """
+    Shared color_enhancement.ColorEnhancer, imported and built on first use.
+    color_enhancement pulls in cv2 and requests, so it is not imported at
+    startup; reusing one instance also keeps its palette cache and any
+    loaded colorization model. Import errors propagate (and are retried).
+    """
+    import color_enhancement
+
+    return color_enhancement.ColorEnhancer()
 
 
 def normalize_theme_colors(theme):
@@ -184,6 +233,20 @@ def normalize_theme_colors(theme):
     return theme
 
 
+@functools.lru_cache(maxsize=None)
+def _file_index(root):
+    """
+    Every file under root as (lowercase name, path), in os.walk order; empty
+    if root does not exist. Font and texture folders do not change during a
+    run, so each is walked once per process instead of on every lookup.
+    """
+    return tuple(
+        (f.lower(), os.path.join(dirpath, f))
+        for dirpath, _, files in os.walk(root)
+        for f in files
+    )
+
+
 def get_font_paths(font_name):
     """
     Get paths for bold, regular, and light variants of a font.
@@ -204,26 +267,19 @@ def get_font_paths(font_name):
     clean_name = font_name.lower().replace(" ", "")
 
     for font_dir in font_dirs:
-        if not os.path.exists(font_dir):
-            continue
-
-        for root, _, files in os.walk(font_dir):
-            for file in files:
-                if not file.lower().endswith((".ttf", ".otf")):
-                    continue
-
-                fname = file.lower()
-
-                # Try to fuzzy match
-                if clean_name in fname:
-                    path = os.path.join(root, file)
-                    if "bold" in fname:
-                        fonts["bold"] = path
-                    elif "light" in fname or "thin" in fname:
-                        fonts["light"] = path
-                    elif "regular" in fname or clean_name in fname:  # Fallback
-                        if fonts["regular"] is None:
-                            fonts["regular"] = path
+        for fname, path in _file_index(font_dir):
+            if not fname.endswith((".ttf", ".otf")):
+                continue
+
+            # Try to fuzzy match
+            if clean_name in fname:
+                if "bold" in fname:
+                    fonts["bold"] = path
+                elif "light" in fname or "thin" in fname:
+                    fonts["light"] = path
+                elif "regular" in fname or clean_name in fname:  # Fallback
+                    if fonts["regular"] is None:
+                        fonts["regular"] = path
 
     # Fill gaps
     if not fonts["regular"]:
@@ -241,6 +297,23 @@ def get_font_paths(font_name):
     return fonts
 
 
+_THEME_FILE_CACHE = {}
+
+
+def _read_theme_file(theme_path):
+    """
+    Parsed and normalized theme JSON, cached by mtime so --all-themes and
+    style overrides parse each file once. Returns a copy the caller may
+    modify. Raises FileNotFoundError if the file is missing.
+    """
+    mtime = os.stat(theme_path).st_mtime
+    cached = _THEME_FILE_CACHE.get(theme_path)
+    if cached is None or cached[0] != mtime:
+        cached = (mtime, normalize_theme_colors(_loads(Path(theme_path).read_bytes())))
+        _THEME_FILE_CACHE[theme_path] = cached
+    return copy.deepcopy(cached[1])
+
+
 def load_theme(theme_name="feature_based", style_overrides=None):
     """
     Load theme from JSON file in themes directory.
@@ -251,11 +324,11 @@ def load_theme(theme_name="feature_based", style_overrides=None):
 
     def _load_single_theme(name):
         theme_file = os.path.join(THEMES_DIR, f"{name}.json")
-        if not os.path.exists(theme_file):
+        try:
+            return _read_theme_file(theme_file)
+        except FileNotFoundError:
             print(f"[!] Theme file '{theme_file}' not found. Using defaults.")
             return {}
-        with open(theme_file, "r", encoding="utf-8") as f:
-            return normalize_theme_colors(json.load(f))
 
     # Load Base Theme
     logger.info(f"Loading base theme: {theme_name}")
@@ -336,6 +409,34 @@ def load_theme(theme_name="feature_based", style_overrides=None):
     return theme
 
 
+@functools.lru_cache(maxsize=128)
+def _load_theme_cached(theme_name, overrides_key=()):
+    """
+    Memoized load_theme. overrides_key is the style_overrides dict as a
+    sorted tuple of items so it can be hashed. Callers must copy the result
+    before mutating it.
+    """
+    return load_theme(theme_name, dict(overrides_key))
+
+
+# (mtime, (display_name, description)) per theme file, for list_themes()
+_THEME_INFO_CACHE = {}
+
+
+def _theme_info(theme_name, theme_path, mtime):
+    """Return (display_name, description) for a theme file, cached by mtime."""
+    cached = _THEME_INFO_CACHE.get(theme_path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    try:
+        theme_data = _loads(Path(theme_path).read_bytes())
+        info = (theme_data.get("name", theme_name), theme_data.get("description", ""))
+    except Exception:
+        info = (theme_name, "")
+    _THEME_INFO_CACHE[theme_path] = (mtime, info)
+    return info
+
+
 # Load theme (can be changed via command line or input)
 THEME = dict[str, str]()  # Will be loaded later
 
@@ -445,6 +546,24 @@ def get_edge_widths_by_type(G):
     return edge_widths
 
 
+# Geocoding results are reused from the disk cache for 30 days
+GEOCODE_TTL_SECONDS = 30 * 24 * 3600
+
+
+def geocode_cache_key(city, country) -> str:
+    """Cache key with case and whitespace normalized ("New  York" == "new york")."""
+    city_norm = " ".join(city.split()).lower()
+    country_norm = " ".join(country.split()).lower()
+    return f"coords_{city_norm}_{country_norm}"
+
+
+def _cache_coords(key, lat, lon):
+    try:
+        cache_set(key, (lat, lon, time.time()))
+    except CacheError as e:
+        print(e)
+
+
 def get_coordinates(city, country, max_retries=3):
     """
     Fetches coordinates for a given city and country using geopy.
@@ -460,9 +579,15 @@ def get_coordinates(city, country, max_retries=3):
     city_clean = city.split(",")[0].strip()
     display_city = city_clean  # Use this for the map label
 
-    coords = f"coords_{city_clean.lower()}_{country.lower()}"
-    cached = cache_get(coords)
-    if cached:
+    coords = geocode_cache_key(city_clean, country)
+    try:
+        cached = cache_get(coords)
+    except CacheError:
+        cached = None
+    # Entries written before the TTL was added have no timestamp
+    if cached and (
+        len(cached) < 3 or time.time() - cached[2] < GEOCODE_TTL_SECONDS
+    ):
         print(f"[*] Using cached coordinates for {city_clean}, {country}")
         return cached[0], cached[1], display_city
 
@@ -532,7 +657,7 @@ def get_coordinates(city, country, max_retries=3):
         if location:
             print(f"[+] Found via Nominatim: {location.address}")
             print(f"[*] Coordinates: {location.latitude}, {location.longitude}")
-            cache_set(coords, (location.latitude, location.longitude))
+            _cache_coords(coords, location.latitude, location.longitude)
             return location.latitude, location.longitude, display_city
     except Exception as e:
         print(f"[*] Nominatim geocoding failed ({e}), switching to fallback...")
@@ -546,7 +671,7 @@ def get_coordinates(city, country, max_retries=3):
         if location:
             print(f"[+] Found via ArcGIS: {location.address}")
             print(f"[*] Coordinates: {location.latitude}, {location.longitude}")
-            cache_set(coords, (location.latitude, location.longitude))
+            _cache_coords(coords, location.latitude, location.longitude)
             return location.latitude, location.longitude, display_city
     except Exception as e:
         print(f"[*] ArcGIS geocoding failed: {e}")
@@ -556,7 +681,7 @@ def get_coordinates(city, country, max_retries=3):
     if country.lower() == "usa" and city_lower in fallback_coords:
         lat, lon = fallback_coords[city_lower]
         print(f"[*] API unavailable - using offline fallback for {city_clean}")
-        cache_set(coords, (lat, lon))
+        _cache_coords(coords, lat, lon)
         return lat, lon, display_city
 
     # Failure
@@ -625,14 +750,40 @@ def fetch_graph(point, dist) -> MultiDiGraph | None:
         return None
 
 
-def fetch_features(point, dist, tags, name) -> GeoDataFrame | None:
+def poster_graph_cache_key(point, dist, network_filter, simplified) -> str:
+    """
+    Cache key for the projected (and optionally simplified) poster graph.
+    The Overpass filter is hashed because it contains characters that are
+    not valid in file names.
+    """
+    lat, lon = point
+    raw = f"{round(lat, 4)}_{round(lon, 4)}_{int(dist)}_{network_filter}_{simplified}"
+    digest = hashlib.sha1(raw.encode("utf-8")).hexdigest()[:16]
+    return f"poster_graph_{digest}"
+
+
+def to_target_crs(gdf, target_crs):
+    """
+    Reproject fetched features into the poster graph's CRS.
+    Done once at fetch time so the plotting phase never has to reproject.
+    The disk cache keeps the WGS84 original, which is valid for any target.
+    """
+    if target_crs is None or gdf is None or gdf.empty:
+        return gdf
+    try:
+        return gdf.to_crs(target_crs)
+    except Exception:
+        return gdf
+
+
+def fetch_features(point, dist, tags, name, target_crs=None) -> GeoDataFrame | None:
     lat, lon = point
     tag_str = "_".join(tags.keys())
     features = f"{name}_{lat}_{lon}_{dist}_{tag_str}"
     cached = cache_get(features)
     if cached is not None:
         print(f"[*] Using cached {name}")
-        return cast(GeoDataFrame, cached)
+        return to_target_crs(cast(GeoDataFrame, cached), target_crs)
 
     try:
         data = ox.features_from_point(point, tags=tags, dist=dist)
@@ -642,13 +793,13 @@ def fetch_features(point, dist, tags, name) -> GeoDataFrame | None:
             cache_set(features, data)
         except CacheError as e:
             print(e)
-        return data
+        return to_target_crs(data, target_crs)
     except Exception as e:
         print(f"OSMnx error while fetching features: {e}")
         return None
 
 
-def fetch_railways(point, dist) -> GeoDataFrame | None:
+def fetch_railways(point, dist, target_crs=None) -> GeoDataFrame | None:
     """
     Fetch railway data (trains, trams, subways, etc.) from OpenStreetMap.
     """
@@ -657,7 +808,7 @@ def fetch_railways(point, dist) -> GeoDataFrame | None:
     cached = cache_get(cache_key)
     if cached is not None:
         print("[*] Using cached railway data")
-        return cast(GeoDataFrame, cached)
+        return to_target_crs(cast(GeoDataFrame, cached), target_crs)
 
     try:
         # Fetch railway features
@@ -670,14 +821,14 @@ def fetch_railways(point, dist) -> GeoDataFrame | None:
             cache_set(cache_key, data)
         except CacheError as e:
             print(e)
-        return data
+        return to_target_crs(data, target_crs)
     except Exception as e:
         print(f"OSMnx error while fetching railways: {e}")
         return None
 
 
 def fetch_cycling_routes(
-    point, dist
+    point, dist, target_crs=None
 ) -> tuple[GeoDataFrame | None, GeoDataFrame | None]:
     """
     Fetch cycling data including cycle routes and bike infrastructure.
@@ -695,7 +846,10 @@ def fetch_cycling_routes(
 
     if routes_cached is not None and ways_cached is not None:
         print("[*] Using cached cycling data")
-        return cast(GeoDataFrame, routes_cached), cast(GeoDataFrame, ways_cached)
+        return (
+            to_target_crs(cast(GeoDataFrame, routes_cached), target_crs),
+            to_target_crs(cast(GeoDataFrame, ways_cached), target_crs),
+        )
 
     cycle_routes = None
     cycleways = None
@@ -724,10 +878,10 @@ def fetch_cycling_routes(
     except Exception as e:
         print(f"OSMnx error while fetching cycleways: {e}")
 
-    return cycle_routes, cycleways
+    return to_target_crs(cycle_routes, target_crs), to_target_crs(cycleways, target_crs)
 
 
-def fetch_transit(point, dist) -> GeoDataFrame | None:
+def fetch_transit(point, dist, target_crs=None) -> GeoDataFrame | None:
     """
     Fetch public transit data (bus routes, stops, etc.).
     """
@@ -736,7 +890,7 @@ def fetch_transit(point, dist) -> GeoDataFrame | None:
     cached = cache_get(cache_key)
     if cached is not None:
         print("[*] Using cached transit data")
-        return cast(GeoDataFrame, cached)
+        return to_target_crs(cast(GeoDataFrame, cached), target_crs)
 
     try:
         tags = {
@@ -749,12 +903,77 @@ def fetch_transit(point, dist) -> GeoDataFrame | None:
             cache_set(cache_key, data)
         except CacheError as e:
             print(e)
-        return data
+        return to_target_crs(data, target_crs)
     except Exception as e:
         print(f"OSMnx error while fetching transit: {e}")
         return None
 
 
+POLYGON_TYPES = {"Polygon", "MultiPolygon"}
+LINE_TYPES = {"LineString", "MultiLineString"}
+
+
+def _polys(gdf):
+    """Return only the polygon rows of a GeoDataFrame."""
+    return gdf[gdf.geom_type.isin(POLYGON_TYPES)]
+
+
+def _lines(gdf):
+    """Return only the line rows of a GeoDataFrame."""
+    return gdf[gdf.geom_type.isin(LINE_TYPES)]
+
+
+def rasterize_lines(
+    ax, gdf, color, xlim, ylim, size_px, linewidth=1.0, dpi=300, alpha=1.0, zorder=1
+):
+    """
+    Draw a large line layer as one datashader raster instead of one matplotlib
+    path per feature. Returns False (nothing drawn) when datashader is not
+    installed, the layer is small, or it contains non-line geometries, so the
+    caller can fall back to vector plotting.
+    """
+    if ds is None or xlim is None or ylim is None:
+        return False
+    if len(gdf) < DATASHADER_MIN_FEATURES or not gdf.geom_type.isin(LINE_TYPES).all():
+        return False
+
+    try:
+        canvas = ds.Canvas(
+            plot_width=int(size_px[0]),
+            plot_height=int(size_px[1]),
+            x_range=tuple(xlim),
+            y_range=tuple(ylim),
+        )
+        agg = canvas.line(gdf, geometry="geometry", agg=ds.any())
+        img = tf.shade(agg, cmap=[color], min_alpha=255)
+        # Approximate the requested stroke width (points) in pixels
+        spread_px = int(linewidth * dpi / 72 / 2)
+        if spread_px > 0:
+            img = tf.spread(img, px=spread_px)
+    except Exception as e:
+        print(f"[*] Datashader rasterization skipped: {e}")
+        return False
+
+    ax.imshow(
+        img.to_pil(),
+        extent=[xlim[0], xlim[1], ylim[0], ylim[1]],
+        origin="upper",
+        interpolation="nearest",
+        alpha=alpha,
+        zorder=zorder,
+    )
+    return True
+
+
+def hide_axes_frame(ax):
+    """Strip ticks, spines and margins the way ox.plot_graph configures its axes."""
+    ax.margins(0)
+    for spine in ax.spines.values():
+        spine.set_visible(False)
+    ax.get_xaxis().set_visible(False)
+    ax.get_yaxis().set_visible(False)
+
+
 def generate_3d_terrain(width, height, output_file):
     """Generate a 3D terrain visualization"""
     print("Generating 3D terrain map...")
@@ -900,6 +1119,44 @@ def apply_shape_to_image(image_path, shape, bg_color="#FFFFFF"):
         print(f"[!] Failed to apply shape: {e}")
 
 
+# Texture strength as a fraction of 256 (~0.15) so the mix is a shift
+TEXTURE_OPACITY_256 = 38
+
+
+def overlay_blend_uint8(base, tex, opacity_256=TEXTURE_OPACITY_256):
+    """
+    Overlay-blend tex onto base and mix the result back at opacity_256/256.
+    Works on uint8 arrays in integer arithmetic, computing both overlay halves
+    for every pixel and selecting with a mask rather than boolean indexing.
+    """
+    b = base.astype(np.int32)
+    t = tex.astype(np.int32)
+
+    # Overlay: 2*b*t if b < 128 else 255 - 2*(255-b)*(255-t), rounded
+    low = (2 * b * t + 127) // 255
+    high = 255 - (2 * (255 - b) * (255 - t) + 127) // 255
+    blended = np.where(b < 128, low, high)
+
+    # Mix original with blended result; keeps the texture subtle
+    out = b + (((blended - b) * opacity_256) >> 8)
+    return out.astype(np.uint8)
+
+
+def find_texture(texture, textures_root=os.path.join("assets", "textures")):
+    """Path of the texture file matching texture, or None."""
+    # Try direct path first
+    direct_path = os.path.join(textures_root, texture)
+    if os.path.isfile(direct_path):
+        return direct_path
+
+    # Exact match or fuzzy match anywhere under the textures folder
+    potential_names = [p.lower() for p in (texture, f"{texture}.jpg", f"{texture}.png")]
+    for name, path in _file_index(textures_root):
+        if name in potential_names or any(p in name for p in potential_names):
+            return path
+    return None
+
+
 def apply_texture_to_image(image_path, texture):
     """Apply texture to an existing image file"""
     if not texture or texture.lower() == "none":
@@ -912,26 +1169,7 @@ def apply_texture_to_image(image_path, texture):
         base_image = PILImage.open(image_path).convert("RGB")
 
         # Load texture - search recursively in assets/textures
-        texture_path = None
-        textures_root = os.path.join("assets", "textures")
-
-        # Try direct path first
-        direct_path = os.path.join(textures_root, texture)
-        if os.path.exists(direct_path) and os.path.isfile(direct_path):
-            texture_path = direct_path
-        else:
-            # Search recursively
-            potential_names = [texture, f"{texture}.jpg", f"{texture}.png"]
-            for root, _, files in os.walk(textures_root):
-                for f in files:
-                    if f.lower() in [p.lower() for p in potential_names] or any(
-                        p.lower() in f.lower() for p in potential_names
-                    ):
-                        # Exact match or fuzzy match
-                        texture_path = os.path.join(root, f)
-                        break
-                if texture_path:
-                    break
+        texture_path = find_texture(texture)
 
         if texture_path and os.path.exists(texture_path):
             print(f"[+] Loading texture from: {texture_path}")
@@ -945,38 +1183,9 @@ def apply_texture_to_image(image_path, texture):
                 texture_img = texture_img.convert("RGB")
 
             # Apply texture with proper blending
-            base_array = np.array(base_image)
-            texture_array = np.array(texture_img)
-
-            # Normalize arrays to 0-1 range
-            base_norm = base_array.astype(float) / 255.0
-            texture_norm = texture_array.astype(float) / 255.0
-
-            # Calculate Overlay blending
-            # Formula: 2*base*tex if base<0.5 else 1-2*(1-base)*(1-tex)
-            low_mask = base_norm < 0.5
-            high_mask = ~low_mask
-
-            blended = np.zeros_like(base_norm)
-
-            # Apply formula for darks
-            blended[low_mask] = 2 * base_norm[low_mask] * texture_norm[low_mask]
-
-            # Apply formula for lights
-            blended[high_mask] = 1 - 2 * (1 - base_norm[high_mask]) * (
-                1 - texture_norm[high_mask]
-            )
-
-            # Mix original with blended result (texture opacity/strength)
-            # Reduced opacity to prevent washing out details
-            opacity = 0.15
-            textured = base_norm * (1 - opacity) + blended * opacity
-
-            # Ensure values stay in valid range
-            textured = np.clip(textured, 0, 1)
-
-            # Convert back to image
-            textured_array = (textured * 255).astype(np.uint8)
+            base_array = np.asarray(base_image)
+            texture_array = np.asarray(texture_img)
+            textured_array = overlay_blend_uint8(base_array, texture_array)
             textured_image = PILImage.fromarray(textured_array)
 
             # Enhance contrast to pop the details
@@ -1077,6 +1286,7 @@ def create_poster(
     map_shape="rectangle",
     map_type="city",
     map_types=None,
+    dpi=300,
 ):
     # Support both dist and distance
     if distance is not None:
@@ -1197,20 +1407,34 @@ def create_poster(
                             '["highway"~"motorway|trunk|primary|secondary|tertiary"]'
                         )
 
-                if custom_filter:
-                    G = ox.graph_from_point(
-                        point, dist=compensated_dist, custom_filter=custom_filter
-                    )
+                simplify = "city" in map_types
+                graph_key = poster_graph_cache_key(
+                    point, compensated_dist, custom_filter or filter_type, simplify
+                )
+                G = cache_get(graph_key)
+                if G is not None:
+                    print("[*] Using cached projected street network")
                 else:
-                    G = ox.graph_from_point(
-                        point, dist=compensated_dist, network_type=filter_type
-                    )
-                G = ox.project_graph(G)
-                if "city" in map_types:
+                    if custom_filter:
+                        G = ox.graph_from_point(
+                            point, dist=compensated_dist, custom_filter=custom_filter
+                        )
+                    else:
+                        G = ox.graph_from_point(
+                            point, dist=compensated_dist, network_type=filter_type
+                        )
+                    G = ox.project_graph(G)
+                    if simplify:
+                        try:
+                            G = ox.simplify_graph(G)
+                        except Exception as simplify_err:
+                            print(
+                                f"Warning: Graph simplification skipped: {simplify_err}"
+                            )
                     try:
-                        G = ox.simplify_graph(G)
-                    except Exception as simplify_err:
-                        print(f"Warning: Graph simplification skipped: {simplify_err}")
+                        cache_set(graph_key, G)
+                    except CacheError as e:
+                        print(e)
             except Exception as e:
                 print(f"Warning: Could not fetch road network: {e}")
                 G = None
@@ -1219,6 +1443,9 @@ def create_poster(
             G = None
             pbar.update(2)
 
+        # Everything below is fetched straight into the graph's CRS
+        target_crs = G.graph["crs"] if G is not None else None
+
         # 2. Water Features
         if any(
             t in map_types
@@ -1229,10 +1456,14 @@ def create_poster(
             if "maritime" in map_types:
                 tags["place"] = "sea"
 
-            water = fetch_features(point, compensated_dist, tags=tags, name="water")
+            water = fetch_features(
+                point, compensated_dist, tags=tags, name="water", target_crs=target_crs
+            )
 
             if "maritime" in map_types and MARITIME_AVAILABLE:
-                coastline = fetch_coastline(point, compensated_dist)
+                coastline = fetch_coastline(
+                    point, compensated_dist, target_crs=target_crs
+                )
                 if coastline is not None:
                     if water is not None:
                         water = water.combine_first(coastline)
@@ -1244,58 +1475,58 @@ def create_poster(
             pbar.update(2)
 
         # 3. Layer Specific Data
-        railways = None
-        if "railway" in map_types:
-            pbar.set_description("Downloading railway data")
-            railways = fetch_railways(point, compensated_dist)
-            pbar.update(1)
-        else:
-            pbar.update(1)
+        # Independent Overpass requests, issued concurrently
+        layer_fetches = {
+            "railway": lambda: fetch_railways(
+                point, compensated_dist, target_crs=target_crs
+            ),
+            "cycling": lambda: fetch_cycling_routes(
+                point, compensated_dist, target_crs=target_crs
+            ),
+            "transit": lambda: fetch_transit(
+                point, compensated_dist, target_crs=target_crs
+            ),
+            "maritime": lambda: fetch_maritime_features(
+                point, compensated_dist, target_crs=target_crs
+            ),
+            "aviation": lambda: fetch_aviation_features(
+                point, compensated_dist, target_crs=target_crs
+            ),
+        }
+        if not MARITIME_AVAILABLE:
+            del layer_fetches["maritime"]
+        layer_fetches = {
+            name: fetch for name, fetch in layer_fetches.items() if name in map_types
+        }
+        if layer_fetches:
+            pbar.set_description(f"Downloading {', '.join(layer_fetches)} data")
+        fetched = fetch_concurrently(layer_fetches)
+        for name, result in fetched.items():
+            if isinstance(result, Exception):
+                print(f"Warning: Could not fetch {name} data: {result}")
+                fetched[name] = None
+        pbar.update(5)
+
+        railways = fetched.get("railway")
 
         cycle_routes, cycleways = None, None
-        if "cycling" in map_types:
-            pbar.set_description("Downloading cycling data")
-            result = fetch_cycling_routes(point, compensated_dist)
-            if isinstance(result, tuple):
-                cycle_routes, cycleways = result
-            else:
-                cycle_routes = result
-            pbar.update(1)
+        result = fetched.get("cycling")
+        if isinstance(result, tuple):
+            cycle_routes, cycleways = result
         else:
-            pbar.update(1)
+            cycle_routes = result
 
-        transit = None
-        if "transit" in map_types:
-            pbar.set_description("Downloading transit data")
-            try:
-                transit = ox.features_from_point(
-                    point, tags={"public_transport": True}, dist=compensated_dist
-                )
-            except Exception:
-                pass
-            pbar.update(1)
-        else:
-            pbar.update(1)
+        transit = fetched.get("transit")
 
         harbors, seamarks = None, None
-        if "maritime" in map_types and MARITIME_AVAILABLE:
-            pbar.set_description("Downloading maritime data")
-            m_res = fetch_maritime_features(point, compensated_dist)
-            if isinstance(m_res, tuple) and len(m_res) == 3:
-                _, harbors, seamarks = m_res
-            pbar.update(1)
-        else:
-            pbar.update(1)
+        m_res = fetched.get("maritime")
+        if isinstance(m_res, tuple) and len(m_res) == 3:
+            _, harbors, seamarks = m_res
 
         airports, runways, airways = None, None, None
-        if "aviation" in map_types:
-            pbar.set_description("Downloading aviation data")
-            result = fetch_aviation_features(point, compensated_dist)
-            if result:
-                airports, runways, airways = result
-            pbar.update(1)
-        else:
-            pbar.update(1)
+        result = fetched.get("aviation")
+        if result:
+            airports, runways, airways = result
 
         visible_stars = None
         if "starmap" in map_types:
@@ -1316,19 +1547,25 @@ def create_poster(
                     "landuse": ["grass", "forest", "wood", "meadow"],
                 },
                 name="parks",
+                target_crs=target_crs,
             )
             landuse = fetch_features(
                 point,
                 compensated_dist,
                 tags={"landuse": ["industrial", "commercial", "residential", "retail"]},
                 name="landuse",
+                target_crs=target_crs,
             )
 
             # Fetch buildings for detail if zoomed in enough (< 40km)
             if compensated_dist < 40000:
                 pbar.set_description("Downloading building footprints")
                 buildings = fetch_features(
-                    point, compensated_dist, tags={"building": True}, name="buildings"
+                    point,
+                    compensated_dist,
+                    tags={"building": True},
+                    name="buildings",
+                    target_crs=target_crs,
                 )
         else:
             parks = None
@@ -1339,7 +1576,7 @@ def create_poster(
     print("Rendering layers...")
 
     # Setup Figure
-    fig = plt.figure(figsize=(width, height), dpi=300)
+    fig = plt.figure(figsize=(width, height), dpi=dpi)
     fig.patch.set_facecolor(THEME["bg"])
 
     if map_shape == "circle":
@@ -1360,10 +1597,16 @@ def create_poster(
 
     # Reset limits
     crop_xlim, crop_ylim = None, None
+    if G is not None:
+        crop_xlim, crop_ylim = get_crop_limits(G, point, fig, compensated_dist)
+
+    # Large line layers can be rasterized in one pass for raster outputs
+    raster_px = (int(width * dpi), int(height * dpi))
+    use_raster = output_format.lower() in RASTER_FORMATS
 
     # LAYER 1: Water
     if water is not None and not water.empty:
-        water_polys = water[water.geometry.type.isin(["Polygon", "MultiPolygon"])]
+        water_polys = _polys(water)
         if not water_polys.empty:
             water_polys.plot(
                 ax=ax, facecolor=THEME["water"], edgecolor="none", zorder=1
@@ -1383,23 +1626,48 @@ def create_poster(
             edge_widths = [w * 1.5 for w in get_edge_widths(G)]  # 50% thicker
         else:
             edge_color = THEME.get("road_default", "#333333")
-            edge_widths = [0.2] * len(G.edges)
-
-        ox.plot_graph(
-            G,
-            ax=ax,
-            bgcolor="none",
-            node_size=0,
-            edge_color=edge_color if "city" in map_types else "#444444",
-            edge_linewidth=edge_widths if "city" in map_types else 0.3,
-            show=False,
-            close=False,
-        )
-        crop_xlim, crop_ylim = get_crop_limits(G, point, fig, compensated_dist)
+            edge_widths = np.full(G.number_of_edges(), 0.2)
+
+        rasterized = False
+        if (
+            use_raster
+            and "city" not in map_types
+            and ds is not None
+            and G.number_of_edges() >= DATASHADER_MIN_FEATURES
+        ):
+            # Single-colour context roads are the biggest layer on
+            # railway/cycling/aviation maps. Checked before converting the
+            # graph, which rasterize_lines would otherwise discard.
+            edges = ox.graph_to_gdfs(G, nodes=False)
+            rasterized = rasterize_lines(
+                ax,
+                edges,
+                "#444444",
+                crop_xlim,
+                crop_ylim,
+                raster_px,
+                dpi=dpi,
+                linewidth=0.3,
+                zorder=1,
+            )
+            if rasterized:
+                hide_axes_frame(ax)
+
+        if not rasterized:
+            ox.plot_graph(
+                G,
+                ax=ax,
+                bgcolor="none",
+                node_size=0,
+                edge_color=edge_color if "city" in map_types else "#444444",
+                edge_linewidth=edge_widths if "city" in map_types else 0.3,
+                show=False,
+                close=False,
+            )
 
     # LAYER 2.1: Landuse (Low detail background features)
     if landuse is not None and not landuse.empty:
-        landuse_polys = landuse[landuse.geometry.type.isin(["Polygon", "MultiPolygon"])]
+        landuse_polys = _polys(landuse)
         if not landuse_polys.empty:
             landuse_polys.plot(
                 ax=ax,
@@ -1411,9 +1679,7 @@ def create_poster(
 
     # LAYER 2.2: Buildings
     if buildings is not None and not buildings.empty:
-        build_polys = buildings[
-            buildings.geometry.type.isin(["Polygon", "MultiPolygon"])
-        ]
+        build_polys = _polys(buildings)
         if not build_polys.empty:
             # Use a color slightly contrasting from background
             build_color = mcolors.to_rgba(
@@ -1429,7 +1695,7 @@ def create_poster(
 
     # LAYER 2.5: Parks
     if parks is not None and not parks.empty:
-        park_polys = parks[parks.geometry.type.isin(["Polygon", "MultiPolygon"])]
+        park_polys = _polys(parks)
         if not park_polys.empty:
             park_polys.plot(
                 ax=ax,
@@ -1441,105 +1707,124 @@ def create_poster(
 
     # LAYER 3: Railways
     if railways is not None and not railways.empty:
-        railway_lines = railways[
-            railways.geometry.type.isin(["LineString", "MultiLineString"])
-        ]
+        railway_lines = _lines(railways)
         if not railway_lines.empty:
-            if G is not None:
-                try:
-                    railway_lines = railway_lines.to_crs(G.graph["crs"])
-                except Exception:
-                    pass
             railway_color = THEME.get("railway", THEME.get("road_primary", "#e94560"))
-            railway_lines.plot(ax=ax, color=railway_color, linewidth=1.5, zorder=5)
+            if not (
+                use_raster
+                and rasterize_lines(
+                    ax,
+                    railway_lines,
+                    railway_color,
+                    crop_xlim,
+                    crop_ylim,
+                    raster_px,
+                    dpi=dpi,
+                    linewidth=1.5,
+                    zorder=5,
+                )
+            ):
+                railway_lines.plot(ax=ax, color=railway_color, linewidth=1.5, zorder=5)
 
     # LAYER 4: Cycling
     if cycle_routes is not None and not cycle_routes.empty:
-        route_lines = cycle_routes[
-            cycle_routes.geometry.type.isin(["LineString", "MultiLineString"])
-        ]
+        route_lines = _lines(cycle_routes)
         if not route_lines.empty:
-            if G is not None:
-                try:
-                    route_lines = route_lines.to_crs(G.graph["crs"])
-                except Exception:
-                    pass
             cycle_color = THEME.get("cycling", "#16c79a")
-            route_lines.plot(ax=ax, color=cycle_color, linewidth=2.0, zorder=6)
+            if not (
+                use_raster
+                and rasterize_lines(
+                    ax,
+                    route_lines,
+                    cycle_color,
+                    crop_xlim,
+                    crop_ylim,
+                    raster_px,
+                    dpi=dpi,
+                    linewidth=2.0,
+                    zorder=6,
+                )
+            ):
+                route_lines.plot(ax=ax, color=cycle_color, linewidth=2.0, zorder=6)
 
     if cycleways is not None and not cycleways.empty:
-        way_lines = cycleways[
-            cycleways.geometry.type.isin(["LineString", "MultiLineString"])
-        ]
+        way_lines = _lines(cycleways)
         if not way_lines.empty:
-            if G is not None:
-                try:
-                    way_lines = way_lines.to_crs(G.graph["crs"])
-                except Exception:
-                    pass
             cycle_color = THEME.get("cycling", "#16c79a")
-            way_lines.plot(ax=ax, color=cycle_color, linewidth=1.0, alpha=0.7, zorder=6)
+            if not (
+                use_raster
+                and rasterize_lines(
+                    ax,
+                    way_lines,
+                    cycle_color,
+                    crop_xlim,
+                    crop_ylim,
+                    raster_px,
+                    dpi=dpi,
+                    linewidth=1.0,
+                    alpha=0.7,
+                    zorder=6,
+                )
+            ):
+                way_lines.plot(
+                    ax=ax, color=cycle_color, linewidth=1.0, alpha=0.7, zorder=6
+                )
 
     # LAYER 5: Transit
     if transit is not None and not transit.empty:
-        transit_points = transit[transit.geometry.type == "Point"]
+        transit_points = transit[transit.geom_type == "Point"]
         if not transit_points.empty:
-            if G is not None:
-                try:
-                    transit_points = transit_points.to_crs(G.graph["crs"])
-                except Exception:
-                    pass
             transit_color = THEME.get("transit", "#FF6B6B")
             transit_points.plot(ax=ax, color=transit_color, markersize=15, zorder=7)
 
     # LAYER 6: Maritime
     if harbors is not None and not harbors.empty:
-        if G is not None:
-            try:
-                harbors = harbors.to_crs(G.graph["crs"])
-            except Exception:
-                pass
         maritime_color = THEME.get("maritime", "#FFD700")
         harbors.plot(ax=ax, color=maritime_color, markersize=30, zorder=6)
 
     if seamarks is not None and not seamarks.empty:
-        if G is not None:
-            try:
-                seamarks = seamarks.to_crs(G.graph["crs"])
-            except Exception:
-                pass
         maritime_color = THEME.get("maritime", "#FF4444")
         seamarks.plot(ax=ax, color=maritime_color, markersize=15, zorder=7)
 
     # LAYER 7: Aviation
     if airports is not None and not airports.empty:
-        if G is not None:
-            try:
-                airports = airports.to_crs(G.graph["crs"])
-            except Exception:
-                pass
         aviation_color = THEME.get("aviation", "#4169E1")
         airports.plot(ax=ax, color=aviation_color, markersize=40, zorder=6)
 
     if runways is not None and not runways.empty:
-        if G is not None:
-            try:
-                runways = runways.to_crs(G.graph["crs"])
-            except Exception:
-                pass
         aviation_color = THEME.get("aviation", "#2F4F4F")
-        runways.plot(ax=ax, color=aviation_color, linewidth=2.0, zorder=4)
+        if not (
+            use_raster
+            and rasterize_lines(
+                ax,
+                runways,
+                aviation_color,
+                crop_xlim,
+                crop_ylim,
+                raster_px,
+                dpi=dpi,
+                linewidth=2.0,
+                zorder=4,
+            )
+        ):
+            runways.plot(ax=ax, color=aviation_color, linewidth=2.0, zorder=4)
 
     # LAYER 8: Starmap
-    if visible_stars:
+    if visible_stars is not None and len(visible_stars[0]):
         if not G and not water:
             ax.set_xlim(-1, 1)
             ax.set_ylim(0, 1)
 
-        star_x = [s[1] for s in visible_stars]
-        star_y = [s[2] for s in visible_stars]
-        sizes = [max(0.1, 5 - s[3]) * 2 for s in visible_stars]
-        ax.scatter(star_x, star_y, s=sizes, color="white", zorder=20, alpha=0.8)
+        # Star names are not needed for plotting
+        _, star_xy, star_mag = visible_stars
+        ax.scatter(
+            star_xy[:, 0],
+            star_xy[:, 1],
+            s=np.maximum(0.1, 5 - star_mag) * 2,
+            color="white",
+            zorder=20,
+            alpha=0.8,
+        )
 
     # Set aspect and limits
     ax.set_aspect("equal", adjustable="box")
@@ -1665,8 +1950,11 @@ def create_poster(
     )
 
     # DPI matters mainly for raster formats
-    if fmt == "png":
-        save_kwargs["dpi"] = 300
+    if fmt in RASTER_FORMATS:
+        save_kwargs["dpi"] = dpi
+    if fmt == "webp":
+        # Lossy WebP encodes far faster than PNG's zlib at no visible cost
+        save_kwargs["pil_kwargs"] = {"lossless": False, "quality": 92, "method": 4}
 
     plt.savefig(output_file, format=fmt, **save_kwargs)
 
@@ -1688,9 +1976,7 @@ def create_poster(
     if artistic_effect != "none":
         print(f"Applying artistic effect: {artistic_effect}")
         try:
-            import color_enhancement
-
-            enhancer = color_enhancement.ColorEnhancer()
+            enhancer = get_color_enhancer()
             enhancer.apply_enhancement(output_file, artistic_effect, city)
             print(f"[+] Artistic effect '{artistic_effect}' applied successfully")
         except Exception as e:
@@ -1700,9 +1986,7 @@ def create_poster(
     if color_enhancement != "none":
         print(f"Applying color enhancement: {color_enhancement}")
         try:
-            import color_enhancement
-
-            enhancer = color_enhancement.ColorEnhancer()
+            enhancer = get_color_enhancer()
             enhancer.apply_enhancement(output_file, color_enhancement, city)
             print(f"[+] Color enhancement '{color_enhancement}' applied successfully")
         except Exception as e:
@@ -1793,25 +2077,87 @@ Generated posters are saved to 'outputs/' directory.
 """)
 
 
+def style_overrides_key(args_dict):
+    """
+    The --style-* overrides as a sorted tuple of (layer, theme) items, with
+    unset values dropped. Hashable, so it doubles as the theme cache key.
+    """
+    return tuple(
+        sorted(
+            (layer, args_dict[f"style_{layer}"])
+            for layer in ("roads", "water", "parks", "transit")
+            if args_dict[f"style_{layer}"]
+        )
+    )
+
+
+def _render_one(theme_name, args_dict, lat, lon, display_city, overrides_key=()):
+    """
+    Render one poster for theme_name. Top-level (and fed plain data) so it
+    can be pickled into ProcessPoolExecutor workers for --all-themes.
+    """
+    output_file = generate_output_filename(
+        args_dict["city"], theme_name, args_dict["format"]
+    )
+    # Load Theme
+    theme = copy.deepcopy(_load_theme_cached(theme_name, overrides_key))
+
+    # Load custom fonts if specified
+    fonts = {}
+    if args_dict["font"]:
+        fonts = get_font_paths(args_dict["font"])
+
+    # Apply intelligence to theme colors if requested
+    if args_dict["color_enhancement"] in ["intelligent_palette", "geographic_colors"]:
+        try:
+            enhancer = get_color_enhancer()
+            # Guess location type based on city name or just use urban
+            theme = enhancer.enhance_theme_colors(theme, location_type="urban")
+        except Exception as e:
+            print(f"[*] Intelligent color enhancement skipped: {e}")
+
+    # Generate Poster
+    create_poster(
+        city=display_city,
+        country=args_dict["country"],
+        point=(lat, lon),
+        dist=args_dict["distance"],
+        output_file=output_file,
+        output_format=args_dict["format"],
+        theme=theme,
+        fonts=fonts,
+        map_types=args_dict["map_type"],
+        state=args_dict["state"],
+        texture=args_dict["texture"],
+        map_shape=args_dict["map_shape"],
+        artistic_effect=args_dict["artistic_effect"],
+        color_enhancement=args_dict["color_enhancement"],
+        dpi=args_dict["dpi"],
+    )
+
+
 def list_themes():
     """List all available themes with descriptions."""
-    available_themes = get_available_themes()
-    if not available_themes:
+    entries = []
+    if os.path.isdir(THEMES_DIR):
+        # One scandir pass gives both the paths and (cached) stat results
+        with os.scandir(THEMES_DIR) as it:
+            entries = sorted(
+                (e for e in it if e.name.endswith(".json")), key=lambda e: e.name
+            )
+    if not entries:
         print("No themes found in 'themes/' directory.")
         return
 
     print("\nAvailable Themes:")
     print("-" * 60)
-    for theme_name in available_themes:
-        theme_path = os.path.join(THEMES_DIR, f"{theme_name}.json")
+    for entry in entries:
+        theme_name = entry.name[:-5]  # Remove .json extension
         try:
-            with open(theme_path, "r") as f:
-                theme_data = json.load(f)
-                display_name = theme_data.get("name", theme_name)
-                description = theme_data.get("description", "")
-        except Exception:
-            display_name = theme_name
-            description = ""
+            mtime = entry.stat().st_mtime
+        except OSError:
+            mtime = None
+        display_name, description = _theme_info(theme_name, entry.path, mtime)
         print(f"  {theme_name}")
         print(f"    {display_name}")
         if description:
@@ -1819,7 +2165,11 @@ def list_themes():
         print()
 
 
-if __name__ == "__main__":
+def build_parser() -> argparse.ArgumentParser:
+    """
+    Command-line parser for the poster generator, built without running it,
+    so the CLI can be inspected or driven in-process.
+    """
     parser = argparse.ArgumentParser(
         description="Generate beautiful map posters for any city",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -1882,9 +2232,15 @@ Examples:
         "--format",
         "-f",
         default="png",
-        choices=["png", "jpg", "jpeg", "svg", "pdf", "ps", "eps", "tiff"],
+        choices=["png", "jpg", "jpeg", "webp", "svg", "pdf", "ps", "eps", "tiff"],
         help="Output format for the poster (default: png)",
     )
+    parser.add_argument(
+        "--dpi",
+        type=int,
+        default=300,
+        help="Resolution for raster formats, 72-1200 (default: 300)",
+    )
     parser.add_argument(
         "--font",
         default="Roboto",
@@ -1949,49 +2305,12 @@ Examples:
     parser.add_argument("--style-parks", type=str, help="Override theme for parks")
     parser.add_argument("--style-transit", type=str, help="Override theme for transit")
 
-    args = parser.parse_args()
+    return parser
 
-    # Validate inputs using input_validation module
-    try:
-        # Get list of available themes for validation
-        avail_themes = get_available_themes()
-
-        # Determine strict validation for theme only if not using all_themes
-        theme_to_validate = args.theme if not args.all_themes else None
-
-        validated = input_validation.safe_input_validator(
-            city=args.city
-            if args.city
-            else "Placeholder",  # avoiding failure if None, checked later
-            country=args.country if args.country else "Placeholder",
-            state=args.state,
-            width=args.width,
-            height=args.height,
-            distance=args.distance,
-            format_str=args.format,
-            theme=theme_to_validate,
-            texture=args.texture,
-            available_themes=avail_themes,
-        )
 
-        # Update args with validated values (only if they were provided originally)
-        if args.city:
-            args.city = validated["city"]
-        if args.country:
-            args.country = validated["country"]
-        if args.state:
-            args.state = validated["state"]
-        args.width = validated["width"]
-        args.height = validated["height"]
-        args.distance = validated["distance"]
-        args.format = validated["format"]
-        if not args.all_themes:
-            args.theme = validated["theme"]
-        args.texture = validated["texture"]
-
-    except input_validation.ValidationError as e:
-        print(f"Input Error: {e}")
-        sys.exit(1)
+if __name__ == "__main__":
+    parser = build_parser()
+    args = parser.parse_args()
 
     # If no arguments provided, show examples
     if len(sys.argv) == 1:
@@ -2009,7 +2328,31 @@ Examples:
         print_examples()
         sys.exit(1)
 
-    available_themes = get_available_themes()
+    # Validate inputs using input_validation module (after the
+    # --list-themes / no-args short-circuits, which need no validation)
+    try:
+        validated = input_validation.validate_cli_args(
+            args, available_themes=available_themes_cached()
+        )
+
+        # Update args with validated values
+        args.city = validated["city"]
+        args.country = validated["country"]
+        if args.state:
+            args.state = validated["state"]
+        args.width = validated["width"]
+        args.height = validated["height"]
+        args.distance = validated["distance"]
+        if not args.all_themes:
+            args.theme = validated["theme"]
+        args.texture = validated["texture"]
+        args.dpi = validated["dpi"]
+
+    except input_validation.ValidationError as e:
+        print(f"Input Error: {e}")
+        sys.exit(1)
+
+    available_themes = available_themes_cached()
     if not available_themes:
         print("No themes found in 'themes/' directory.")
         os.sys.exit(1)
@@ -2036,54 +2379,38 @@ Examples:
         else:
             lat, lon = coords[:2]  # Take first two values in case it's a tuple
             display_city = args.city.split(",")[0].strip()
-        for theme_name in themes_to_generate:
-            output_file = generate_output_filename(args.city, theme_name, args.format)
-            # Load Theme
-            style_overrides = {
-                "roads": args.style_roads,
-                "water": args.style_water,
-                "parks": args.style_parks,
-                "transit": args.style_transit,
-            }
-
-            # Filter out None values
-            style_overrides = {k: v for k, v in style_overrides.items() if v}
-
-            THEME = load_theme(theme_name, style_overrides)
-
-            # Load custom fonts if specified
-            FONTS = {}
-            if args.font:
-                FONTS = get_font_paths(args.font)
-
-            # Apply intelligence to theme colors if requested
-            if args.color_enhancement in ["intelligent_palette", "geographic_colors"]:
-                try:
-                    import color_enhancement
-
-                    enhancer = color_enhancement.ColorEnhancer()
-                    # Guess location type based on city name or just use urban
-                    THEME = enhancer.enhance_theme_colors(THEME, location_type="urban")
-                except Exception as e:
-                    print(f"[*] Intelligent color enhancement skipped: {e}")
-
-            # Generate Poster
-            create_poster(
-                city=display_city,
-                country=args.country,
-                point=(lat, lon),
-                dist=args.distance,
-                output_file=output_file,
-                output_format=args.format,
-                theme=THEME,
-                fonts=FONTS,
-                map_types=args.map_type,
-                state=args.state,
-                texture=args.texture,
-                map_shape=args.map_shape,
-                artistic_effect=args.artistic_effect,
-                color_enhancement=args.color_enhancement,
-            )
+
+        args_dict = vars(args)
+        # Same overrides for every theme, so build the cache key once
+        overrides_key = style_overrides_key(args_dict)
+        first_theme, *other_themes = themes_to_generate
+
+        # The first poster runs in-process so it populates the OSM cache that
+        # the remaining themes (same city, same data) then read from
+        _render_one(first_theme, args_dict, lat, lon, display_city, overrides_key)
+
+        if other_themes:
+            max_workers = min(len(other_themes), os.cpu_count() or 1)
+            # Spawned, not forked: by now this process has numba/tqdm threads
+            # running, and forking a multithreaded process can deadlock
+            with ProcessPoolExecutor(
+                max_workers=max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            ) as executor:
+                futures = [
+                    executor.submit(
+                        _render_one,
+                        theme_name,
+                        args_dict,
+                        lat,
+                        lon,
+                        display_city,
+                        overrides_key,
+                    )
+                    for theme_name in other_themes
+                ]
+                for future in as_completed(futures):
+                    future.result()
 
         print("\n" + "=" * 50)
         print("[*] Poster generation complete!")
@@ -3,6 +3,7 @@ Input validation and sanitization module for Map Poster Generator.
 Provides secure input handling and validation functions.
 """
 
+import functools
 import re
 import os
 from typing import Tuple, Optional
@@ -17,34 +18,44 @@ class ValidationError(Exception):
 # Allowed characters for city/country names (unicode letters, spaces, hyphens, apostrophes)
 SAFE_NAME_PATTERN = re.compile(r"^[\w\s\-\'\.\,\(\)]+$", re.UNICODE)
 
+# Control characters and path-traversal sequences, checked in one pass
+_INVALID_RE = re.compile(r"[\x00-\x1f]|\.\.|//|\\")
+
 # Maximum input lengths
 MAX_CITY_LENGTH = 100
 MAX_COUNTRY_LENGTH = 100
 MAX_STATE_LENGTH = 50
 
 # Dangerous path characters and patterns
-DANGEROUS_PATH_CHARS = ["..", "//", "\\", "\x00", "\n", "\r"]
-DANGEROUS_FILE_EXTENSIONS = [".exe", ".bat", ".cmd", ".sh", ".ps1", ".vbs", ".js"]
+# (multi-character patterns, so a tuple for substring checks)
+DANGEROUS_PATH_CHARS = ("..", "//", "\\", "\x00", "\n", "\r")
+DANGEROUS_FILE_EXTENSIONS = frozenset(
+    {".exe", ".bat", ".cmd", ".sh", ".ps1", ".vbs", ".js"}
+)
 
 # Allowed output formats
-ALLOWED_FORMATS = {"png", "jpg", "jpeg", "svg", "pdf"}
+ALLOWED_FORMATS = frozenset({"png", "jpg", "jpeg", "webp", "svg", "pdf"})
 
 # Allowed map shapes
-ALLOWED_SHAPES = {"rectangle", "circle", "triangle"}
+ALLOWED_SHAPES = frozenset({"rectangle", "circle", "triangle"})
 
 # Allowed artistic effects
-ALLOWED_EFFECTS = {"none", "watercolor", "pencil_sketch", "oil_painting", "vintage"}
+ALLOWED_EFFECTS = frozenset(
+    {"none", "watercolor", "pencil_sketch", "oil_painting", "vintage"}
+)
 
 # Allowed color enhancements
-ALLOWED_ENHANCEMENTS = {
-    "none",
-    "intelligent_palette",
-    "geographic_colors",
-    "seasonal_summer",
-    "seasonal_autumn",
-    "seasonal_winter",
-    "seasonal_spring",
-}
+ALLOWED_ENHANCEMENTS = frozenset(
+    {
+        "none",
+        "intelligent_palette",
+        "geographic_colors",
+        "seasonal_summer",
+        "seasonal_autumn",
+        "seasonal_winter",
+        "seasonal_spring",
+    }
+)
 
 
 def sanitize_city_country(
@@ -81,18 +92,10 @@ def sanitize_city_country(
     if len(name) == 0:
         raise ValidationError("Input cannot be empty")
 
-    # Check for dangerous characters
-    for char in DANGEROUS_PATH_CHARS:
-        if char in name:
-            raise ValidationError(f"Input contains invalid characters")
-
-    # Allow unicode letters, numbers, spaces, and common punctuation
-    # Block control characters and special symbols
-    if not SAFE_NAME_PATTERN.match(name):
-        # More lenient: just block control characters
-        for char in name:
-            if ord(char) < 32:  # Control characters
-                raise ValidationError("Input contains invalid control characters")
+    # Block control characters and path-traversal sequences; other unicode
+    # letters, numbers and punctuation are allowed
+    if _INVALID_RE.search(name):
+        raise ValidationError("Input contains invalid characters")
 
     return name
 
@@ -230,6 +233,33 @@ def validate_distance(distance: int) -> int:
     return distance
 
 
+def validate_dpi(dpi: int) -> int:
+    """
+    Validate output resolution.
+
+    Args:
+        dpi: Dots per inch
+
+    Returns:
+        Validated dpi
+    """
+    try:
+        dpi = int(dpi)
+    except (TypeError, ValueError):
+        raise ValidationError("DPI must be an integer")
+
+    MIN_DPI = 72
+    MAX_DPI = 1200
+
+    if dpi < MIN_DPI:
+        raise ValidationError(f"DPI must be at least {MIN_DPI}")
+
+    if dpi > MAX_DPI:
+        raise ValidationError(f"DPI cannot exceed {MAX_DPI}")
+
+    return dpi
+
+
 def sanitize_filename(filename: str) -> str:
     """
     Sanitize a filename to prevent path traversal.
@@ -259,6 +289,12 @@ def sanitize_filename(filename: str) -> str:
     return filename
 
 
+@functools.lru_cache(maxsize=32)
+def _name_lookup(names: tuple) -> dict:
+    """Map lowercase names to their original casing, built once per name list."""
+    return {n.lower(): n for n in names}
+
+
 def validate_theme_name(theme: str, available_themes: list) -> str:
     """
     Validate theme name against available themes.
@@ -275,17 +311,14 @@ def validate_theme_name(theme: str, available_themes: list) -> str:
 
     theme = theme.lower().strip()
 
-    if theme not in [t.lower() for t in available_themes]:
+    # Map lowercase names back to the properly cased theme name
+    original = _name_lookup(tuple(available_themes)).get(theme)
+    if original is None:
         raise ValidationError(
             f"Theme '{theme}' not found. Available: {', '.join(available_themes)}"
         )
 
-    # Return the properly cased theme name
-    for t in available_themes:
-        if t.lower() == theme:
-            return t
-
-    return theme
+    return original
 
 
 def validate_texture_name(texture: str, available_textures: list) -> str:
@@ -295,36 +328,19 @@ def validate_texture_name(texture: str, available_textures: list) -> str:
 
     texture = texture.lower().strip()
 
-    if texture not in [t.lower() for t in available_textures]:
+    original = _name_lookup(tuple(available_textures)).get(texture)
+    if original is None:
         raise ValidationError(
             f"Texture '{texture}' not found. Available: {', '.join(available_textures)}"
         )
 
-    for t in available_textures:
-        if t.lower() == texture:
-            return t
+    return original
 
-    return texture
 
-
-def safe_input_validator(
-    city: str,
-    country: str,
-    state: Optional[str] = None,
-    width: Optional[float] = None,
-    height: Optional[float] = None,
-    distance: Optional[int] = None,
-    format_str: Optional[str] = None,
-    theme: Optional[str] = None,
-    texture: Optional[str] = None,
-    available_themes: Optional[list] = None,
-    available_textures: Optional[list] = None,
+def _validate_free_form(
+    city, country, state, width, height, distance, theme, available_themes
 ) -> dict:
-    """
-    Comprehensive input validator for all user inputs.
-
-    Returns a dictionary of validated values or raises ValidationError.
-    """
+    """Validate the free-form inputs shared by the CLI and API entry points."""
     result = {}
 
     # Validate city and country
@@ -353,18 +369,68 @@ def safe_input_validator(
     else:
         result["distance"] = 12000
 
-    # Validate format
-    if format_str:
-        result["format"] = validate_output_format(format_str)
-    else:
-        result["format"] = "png"
-
     # Validate theme
     if theme and available_themes:
         result["theme"] = validate_theme_name(theme, available_themes)
     else:
         result["theme"] = theme or "feature_based"
 
+    return result
+
+
+def validate_cli_args(args, available_themes: Optional[list] = None) -> dict:
+    """
+    Validate parsed command-line arguments.
+
+    Flags constrained by argparse ``choices`` (format, shape, effect,
+    enhancement) are trusted as-is; only free-form values are checked.
+    The theme is skipped when --all-themes is set.
+
+    Returns a dictionary of validated values or raises ValidationError.
+    """
+    result = _validate_free_form(
+        args.city,
+        args.country,
+        args.state,
+        args.width,
+        args.height,
+        args.distance,
+        None if args.all_themes else args.theme,
+        available_themes,
+    )
+    result["texture"] = args.texture or "none"
+    result["dpi"] = validate_dpi(args.dpi)
+    return result
+
+
+def validate_api_args(
+    city: str,
+    country: str,
+    state: Optional[str] = None,
+    width: Optional[float] = None,
+    height: Optional[float] = None,
+    distance: Optional[int] = None,
+    format_str: Optional[str] = None,
+    theme: Optional[str] = None,
+    texture: Optional[str] = None,
+    available_themes: Optional[list] = None,
+    available_textures: Optional[list] = None,
+) -> dict:
+    """
+    Comprehensive input validator for programmatic callers.
+
+    Returns a dictionary of validated values or raises ValidationError.
+    """
+    result = _validate_free_form(
+        city, country, state, width, height, distance, theme, available_themes
+    )
+
+    # Validate format
+    if format_str:
+        result["format"] = validate_output_format(format_str)
+    else:
+        result["format"] = "png"
+
     # Validate texture
     if texture and available_textures:
         result["texture"] = validate_texture_name(texture, available_textures)
@@ -372,3 +438,7 @@ def safe_input_validator(
         result["texture"] = texture or "none"
 
     return result
+
+
+# Backwards-compatible name
+safe_input_validator = validate_api_args
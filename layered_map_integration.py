@@ -7,30 +7,28 @@ Provides concrete render functions for each map type using the existing fetching
 
 from __future__ import annotations
 
+import functools
 import os
-import sys
-from pathlib import Path
-from typing import TYPE_CHECKING, Optional
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Optional, Sequence, Union
 
-import matplotlib.pyplot as plt
-import osmnx as ox
-from matplotlib.axes import Axes
+import numpy as np
+import shapely
 from shapely.geometry import Point
 
+import logging_config
+from map_layer_compositor import BlendMode, LayerData
+
 if TYPE_CHECKING:
-    from map_layer_compositor import LayerCompositor, MapLayer
+    from matplotlib.axes import Axes
+    from matplotlib.path import Path as MplPath
 
-# Add parent directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent))
+    from map_layer_compositor import LayerCompositor, MapLayer
 
-import logging_config
-from create_map_poster import (
-    fetch_features,
-    fetch_graph,
-    get_crop_limits,
-    get_edge_colors_by_type,
-    get_edge_widths_by_type,
-)
+# matplotlib, osmnx and create_map_poster (which pulls in pyplot) are imported
+# where they are used, so importing this module for LAYER_PRESETS or LayerSpec
+# stays cheap
 
 # Import map providers
 try:
@@ -40,14 +38,447 @@ except ImportError:
     fetch_cycling_routes = None
     fetch_railways = None
 
+__all__ = [
+    "LAYER_PRESETS",
+    "LayerSpec",
+    "build_layered_composition",
+    "create_city_layer_renderer",
+    "create_cycling_layer_renderer",
+    "create_maritime_layer_renderer",
+    "create_preset_layered_map",
+    "create_railway_layer_renderer",
+    "create_transit_layer_renderer",
+]
+
 logger = logging_config.logger
 
+# Overpass fetches are network-bound, so a layer's independent requests run
+# concurrently. Kept small to stay within Overpass limits.
+FETCH_WORKERS = int(os.environ.get("LAYER_FETCH_WORKERS", "4"))
+
+
+WATER_TAGS = {"natural": "water", "waterway": "riverbank"}
+PARK_TAGS = {"leisure": "park", "landuse": "grass"}
+SEA_TAGS = {"natural": "water", "waterway": "riverbank", "place": "sea"}
+COASTLINE_TAGS = {"natural": "coastline"}
+
+
+def _point_key(point) -> tuple | bytes:
+    """Hashable form of a center point (shapely Point or (lat, lon) tuple)."""
+    return point.wkb if hasattr(point, "wkb") else tuple(point)
+
+
+def _tags_key(tags: dict) -> tuple:
+    """Hashable, order-independent form of an OSM tag filter."""
+    return tuple(
+        sorted((k, tuple(v) if isinstance(v, list) else v) for k, v in tags.items())
+    )
+
+
+# Attribute columns the renderers read; every other OSM tag column is
+# dropped at the fetch boundary so projection and plotting never carry them
+KEEP_COLUMNS = frozenset({"railway", "route_type"})
+
+
+def _prune_columns(data):
+    """Keep only geometry and KEEP_COLUMNS of a fetched GeoDataFrame (or tuple of them)."""
+    if isinstance(data, tuple):
+        return tuple(_prune_columns(part) for part in data)
+    if not hasattr(data, "geometry") or not hasattr(data, "columns"):
+        return data
+    geometry = data.geometry.name
+    keep = [c for c in data.columns if c == geometry or c in KEEP_COLUMNS]
+    if len(keep) == len(data.columns):
+        return data
+    return data[keep].copy()
+
+
+def _point_from_key(key):
+    """Inverse of _point_key."""
+    return shapely.from_wkb(key) if isinstance(key, bytes) else key
+
+
+# Process-wide memo of OSM fetches: repeated compositions of the same place
+# (presets, theme previews) reuse results instead of re-querying. Failures
+# raise instead of returning None so they are not memoized.
+@functools.lru_cache(maxsize=64)
+def _cached_fetch_graph(point_key, distance):
+    from create_map_poster import fetch_graph
+
+    G = fetch_graph(_point_from_key(point_key), distance)
+    if G is None:
+        raise LookupError("no street network data")
+    return G
+
+
+@functools.lru_cache(maxsize=64)
+def _cached_fetch_features(point_key, distance, tags_key: tuple, name: str):
+    from create_map_poster import fetch_features
+
+    tags = {k: list(v) if isinstance(v, tuple) else v for k, v in tags_key}
+    gdf = fetch_features(_point_from_key(point_key), distance, tags=tags, name=name)
+    if gdf is None:
+        raise LookupError(f"no {name} data")
+    return _prune_columns(gdf)
+
+
+def _graph_fetch(point, distance) -> tuple:
+    key = ("graph", _point_key(point), distance)
+    return key, lambda: _cached_fetch_graph(key[1], distance)
+
+
+def _features_fetch(point, distance, tags: dict, name: str) -> tuple:
+    key = (name, _point_key(point), distance, _tags_key(tags))
+    return key, lambda: _cached_fetch_features(key[1], distance, key[3], name)
+
+
+def _provider_fetch(kind: str, fetch, point, distance) -> tuple:
+    return (
+        (kind, _point_key(point), distance),
+        lambda: fetch(point, distance),
+    )
+
+
+def _fetch_missing(
+    layer_data: LayerData, fetchers: dict, shared_cache: Optional[dict] = None
+) -> None:
+    """
+    Fill the slots of layer_data that have not been fetched yet.
+
+    fetchers maps each layer_data slot to a (cache_key, zero-arg fetch) pair.
+    Results already in shared_cache (fetched by another layer of the same
+    composition) are reused; the rest run concurrently and are stored in both
+    dicts, with None recorded on failure.
+
+    The fetch pool is per call and joined before returning, so no fetch
+    threads outlive it (the compositor's render workers may start next).
+    """
+    if shared_cache is None:
+        shared_cache = {}
+
+    pending = {}
+    for key, (cache_key, fn) in fetchers.items():
+        if key in layer_data.fetched:
+            continue
+        if cache_key in shared_cache:
+            setattr(layer_data, key, shared_cache[cache_key])
+            layer_data.fetched.add(key)
+        else:
+            pending[key] = (cache_key, fn)
+    if not pending:
+        return
+
+    with ThreadPoolExecutor(
+        max_workers=min(FETCH_WORKERS, len(pending)), thread_name_prefix="layer-fetch"
+    ) as executor:
+        futures = {
+            executor.submit(fn): (key, cache_key)
+            for key, (cache_key, fn) in pending.items()
+        }
+        for future in as_completed(futures):
+            key, cache_key = futures[future]
+            try:
+                result = _prune_columns(future.result())
+            except Exception as e:
+                logger.warning(f"Failed to fetch {key}: {e}")
+                result = None
+            shared_cache[cache_key] = result
+            setattr(layer_data, key, result)
+            layer_data.fetched.add(key)
+
+
+POLYGON_TYPES = ["Polygon", "MultiPolygon"]
+# shapely.get_type_id codes
+POINT_TYPE_ID = 0
+LINE_TYPE_IDS = [1, 5]  # LineString, MultiLineString
+
+
+def _polygons(gdf):
+    """Polygon rows of gdf, filtered on the vectorized geom_type array."""
+    return gdf[gdf.geom_type.isin(POLYGON_TYPES)]
+
+
+def _lines(gdf):
+    """Line rows of gdf, filtered on shapely's integer type ids."""
+    return gdf.iloc[np.isin(shapely.get_type_id(gdf.geometry.values), LINE_TYPE_IDS)]
+
+
+def _points(gdf):
+    """Point rows of gdf, filtered on shapely's integer type ids."""
+    return gdf.iloc[shapely.get_type_id(gdf.geometry.values) == POINT_TYPE_ID]
+
+
+def _gdf_to_path(geoms, closed: bool) -> Optional[MplPath]:
+    """
+    Whole layer as a single matplotlib Path built from flat coordinate
+    arrays: MOVETO at each ring/part start, LINETO elsewhere and, for
+    polygons, CLOSEPOLY at each ring end.
+
+    Polygon rings are reoriented (exteriors counter-clockwise, holes
+    clockwise) so that, under the nonzero fill rule, overlapping polygons in
+    the one path stay filled while holes stay open.
+    """
+    parts = shapely.get_parts(geoms)
+    if closed:
+        parts, ring_poly = shapely.get_rings(parts, return_index=True)
+        is_exterior = np.diff(ring_poly, prepend=-1) != 0
+    coords, idx = shapely.get_coordinates(parts, return_index=True)
+    n = len(coords)
+    if n == 0:
+        return None
+
+    starts = np.flatnonzero(np.diff(idx, prepend=-1))
+    lengths = np.diff(np.append(starts, n))
+
+    if closed:
+        # Shoelace signed area per ring; terms spanning two rings are dropped
+        x, y = coords[:, 0], coords[:, 1]
+        cross = np.zeros(n)
+        cross[:-1] = x[:-1] * y[1:] - x[1:] * y[:-1]
+        cross[lengths.cumsum() - 1] = 0.0
+        area = np.add.reduceat(cross, starts)
+        flip = (area > 0) != is_exterior[idx[starts]]
+        if flip.any():
+            ring_start = np.repeat(starts, lengths)
+            reversed_pos = 2 * ring_start + np.repeat(lengths, lengths) - 1 - np.arange(n)
+            coords = coords[np.where(np.repeat(flip, lengths), reversed_pos, np.arange(n))]
+
+    from matplotlib.path import Path as MplPath
+
+    codes = np.full(n, MplPath.LINETO, dtype=MplPath.code_type)
+    codes[starts] = MplPath.MOVETO
+    if closed:
+        codes[starts + lengths - 1] = MplPath.CLOSEPOLY
+    return MplPath(coords, codes)
+
+
+def _layer_path(gdf, kind: str, cache: Optional[dict]) -> Optional[MplPath]:
+    """
+    Path for the polygon (kind="polygons") or line (kind="lines") rows of
+    gdf. Cached per source object, so water, which appears in most layers,
+    is converted once per composition. Pass cache=None for throwaway subsets.
+    """
+    def build():
+        rows = _polygons(gdf) if kind == "polygons" else _lines(gdf)
+        if rows.empty:
+            return None
+        return _gdf_to_path(rows.geometry.values, closed=kind == "polygons")
+
+    if cache is None:
+        return build()
+    key = ("path", kind, id(gdf))
+    hit = cache.get(key)
+    if hit is None or hit[0] is not gdf:
+        hit = cache[key] = (gdf, build())
+    return hit[1]
+
+
+def _line_segments(geoms) -> list:
+    """Vertex arrays for every LineString part of geoms."""
+    parts = shapely.get_parts(geoms)
+    coords, part_idx = shapely.get_coordinates(parts, return_index=True)
+    if len(coords) == 0:
+        return []
+    return np.split(coords, np.flatnonzero(np.diff(part_idx)) + 1)
+
+
+def _add_colored_lines(
+    ax: Axes, gdf, colors, linewidth=1.0, zorder=1,
+) -> bool:
+    """
+    Draw the lines of gdf as one LineCollection, colored colors[i] for
+    row i. Returns False if there were none.
+    """
+    parts, row_idx = shapely.get_parts(gdf.geometry.values, return_index=True)
+    coords, part_idx = shapely.get_coordinates(parts, return_index=True)
+    if len(coords) == 0:
+        return False
+    starts = np.flatnonzero(np.diff(part_idx, prepend=-1))
+    from matplotlib.collections import LineCollection
+
+    ax.add_collection(LineCollection(
+        np.split(coords, starts[1:]),
+        colors=np.asarray(colors)[row_idx[part_idx[starts]]],
+        linewidths=linewidth,
+        zorder=zorder,
+    ))
+    ax.autoscale_view()
+    return True
+
+
+def _add_polygons(
+    ax: Axes, gdf, cache: Optional[dict], facecolor,
+    edgecolor="none", linewidth=0.0, zorder=1,
+) -> bool:
+    """Draw all polygons of gdf as one PathPatch. Returns False if there were none."""
+    from matplotlib.patches import PathPatch
+
+    path = _layer_path(gdf, "polygons", cache)
+    if path is None:
+        return False
+    ax.add_patch(PathPatch(
+        path, facecolor=facecolor, edgecolor=edgecolor,
+        linewidth=linewidth, zorder=zorder,
+    ))
+    ax.autoscale_view()
+    return True
+
+
+def _add_lines(
+    ax: Axes, gdf, cache: Optional[dict], color,
+    linewidth=1.0, linestyle="solid", zorder=1,
+) -> bool:
+    """Draw all lines of gdf as one unfilled PathPatch. Returns False if there were none."""
+    from matplotlib.patches import PathPatch
+
+    path = _layer_path(gdf, "lines", cache)
+    if path is None:
+        return False
+    ax.add_patch(PathPatch(
+        path, fill=False, edgecolor=color, linewidth=linewidth,
+        linestyle=linestyle, zorder=zorder,
+    ))
+    ax.autoscale_view()
+    return True
+
+
+def _edge_segments(G_proj, cache: dict) -> list:
+    """
+    Edge vertex arrays of G_proj, in G.edges order, computed once per
+    composition. The segments are cached rather than an artist because a
+    matplotlib artist cannot be added to more than one axes.
+    """
+    key = ("edge_segments", id(G_proj))
+    hit = cache.get(key)
+    if hit is None or hit[0] is not G_proj:
+        import osmnx as ox
+
+        edges = ox.graph_to_gdfs(G_proj, nodes=False, fill_edge_geometry=True)
+        hit = cache[key] = (G_proj, _line_segments(edges.geometry.values))
+    return hit[1]
+
+
+def _add_graph_edges(
+    ax: Axes, G_proj, point, distance, cache: dict, color, linewidth, bgcolor
+):
+    """
+    Draw the road network as one LineCollection and frame the axes on the
+    poster crop, without going through ox.plot_graph's per-call graph to
+    GeoDataFrame conversion and axes setup.
+    """
+    from matplotlib.collections import LineCollection
+
+    from create_map_poster import get_crop_limits
+
+    ax.add_collection(LineCollection(
+        _edge_segments(G_proj, cache), colors=color, linewidths=linewidth,
+    ))
+    ax.set_facecolor(bgcolor)
+    xlim, ylim = get_crop_limits(G_proj, point, ax.figure, distance)
+    ax.set_xlim(xlim)
+    ax.set_ylim(ylim)
+
+
+def _simplify_tolerance(ax: Axes, distance: float, pixels: float = 0.75) -> float:
+    """
+    Simplification tolerance in projected meters equal to `pixels` output
+    pixels: the crop spans 2 * distance meters across the figure width.
+    """
+    fig = ax.figure
+    width_px = fig.get_size_inches()[0] * fig.dpi
+    return 2 * distance / width_px * pixels
+
+
+def _simplified(gdf, tolerance, cache: dict):
+    """
+    Douglas-Peucker simplify gdf's geometries (vectorized in shapely 2) so
+    sub-pixel vertices are never handed to matplotlib. Cached per source
+    object and tolerance; needs projected (metric) coordinates.
+    """
+    if gdf is None or gdf.empty or not tolerance:
+        return gdf
+    key = ("simplified", id(gdf), round(tolerance, 1))
+    hit = cache.get(key)
+    if hit is None or hit[0] is not gdf:
+        simplified = gdf.geometry.simplify(tolerance, preserve_topology=False)
+        hit = cache[key] = (gdf, gdf.set_geometry(simplified))
+    return hit[1]
+
+
+def _view_bounds(G_proj, point, ax: Axes, distance: float, pad: float = 0.02) -> tuple:
+    """
+    Poster crop as (xmin, ymin, xmax, ymax) in G_proj's CRS, padded by
+    `pad` * distance so clip edges (and stroked outlines) stay off-canvas.
+    """
+    from create_map_poster import get_crop_limits
+
+    xlim, ylim = get_crop_limits(G_proj, point, ax.figure, distance)
+    margin = pad * distance
+    return (xlim[0] - margin, ylim[0] - margin, xlim[1] + margin, ylim[1] + margin)
+
+
+def _clipped(gdf, bounds, cache: dict):
+    """
+    Drop gdf rows outside bounds and cut the rest to it with shapely 2's
+    vectorized intersects/clip_by_rect, so Overpass over-fetch never
+    reaches simplify or matplotlib. Cached per source object and bounds.
+    """
+    if gdf is None or gdf.empty or bounds is None:
+        return gdf
+    key = ("clipped", id(gdf), bounds)
+    hit = cache.get(key)
+    if hit is None or hit[0] is not gdf:
+        geoms = gdf.geometry.values
+        inside = gdf.iloc[shapely.intersects(geoms, shapely.box(*bounds))]
+        cut = shapely.clip_by_rect(inside.geometry.values, *bounds)
+        clipped = inside.set_geometry(cut, crs=gdf.crs)
+        hit = cache[key] = (gdf, clipped.iloc[~shapely.is_empty(cut)])
+    return hit[1]
+
+
+def _prepared(gdf, crs, bounds, tolerance, cache: dict):
+    """Project, clip to the view and simplify gdf, each step cached."""
+    projected = _get_projected_gdf(gdf, crs, cache)
+    return _simplified(_clipped(projected, bounds, cache), tolerance, cache)
+
+
+def _get_projected_graph(G, cache: dict):
+    """Project G once per composition; later layers reuse the projected graph."""
+    key = ("projected_graph", id(G))
+    hit = cache.get(key)
+    # Keep the source object in the entry so its id cannot be recycled
+    if hit is None or hit[0] is not G:
+        import osmnx as ox
+
+        hit = cache[key] = (G, ox.project_graph(G))
+    return hit[1]
+
+
+def _get_projected_gdf(gdf, crs, cache: dict):
+    """
+    Reproject gdf into crs once per composition. Returns gdf unchanged when
+    it is empty or there is no target CRS (no projected graph to align with).
+    """
+    if gdf is None or gdf.empty or crs is None:
+        return gdf
+    key = ("projected_gdf", id(gdf), str(crs))
+    hit = cache.get(key)
+    if hit is None or hit[0] is not gdf:
+        try:
+            projected = gdf.to_crs(crs)
+        except Exception as e:
+            logger.warning(f"Could not project layer data: {e}")
+            projected = gdf
+        hit = cache[key] = (gdf, projected)
+    return hit[1]
+
 
 def create_city_layer_renderer(
     point: Point,
     distance: float,
     theme: dict,
     fig_size: tuple[float, float],
+    shared_cache: Optional[dict] = None,
 ):
     """
     Create a render function for city/street network layer.
@@ -57,79 +488,71 @@ def create_city_layer_renderer(
         distance: Viewport distance in meters
         theme: Color theme dictionary
         fig_size: Figure size (width, height) in inches
+        shared_cache: Fetch results shared between layers of one composition
         
     Returns:
-        Render function for LayerCompositor
+        Render function for LayerCompositor (its .fetch fills layer_data only)
     """
-    def render(ax: Axes, layer_data: dict):
+    if shared_cache is None:
+        shared_cache = {}
+    
+    def fetch(layer_data: LayerData):
+        """Fetch city layer data if not cached."""
+        _fetch_missing(layer_data, {
+            'graph': _graph_fetch(point, distance),
+            'water': _features_fetch(point, distance, WATER_TAGS, "water"),
+            'parks': _features_fetch(point, distance, PARK_TAGS, "parks"),
+        }, shared_cache)
+    
+    def render(ax: Axes, layer_data: LayerData):
         """Render city layer to axes."""
-        # Fetch data if not cached
-        if 'graph' not in layer_data:
-            layer_data['graph'] = fetch_graph(point, distance)
-            layer_data['water'] = fetch_features(
-                point, distance,
-                tags={"natural": "water", "waterway": "riverbank"},
-                name="water"
-            )
-            layer_data['parks'] = fetch_features(
-                point, distance,
-                tags={"leisure": "park", "landuse": "grass"},
-                name="parks"
-            )
+        fetch(layer_data)
         
-        G = layer_data.get('graph')
-        water = layer_data.get('water')
-        parks = layer_data.get('parks')
+        G = layer_data.graph
+        water = layer_data.water
+        parks = layer_data.parks
         
         if G is None:
             ax.text(0.5, 0.5, 'No street data available',
                    ha='center', va='center', transform=ax.transAxes)
             return
         
-        # Project graph
-        G_proj = ox.project_graph(G)
+        # Project, clip and simplify once; every layer of the composition reuses it
+        G_proj = _get_projected_graph(G, shared_cache)
+        crs = G_proj.graph["crs"]
+        tol = _simplify_tolerance(ax, distance) if crs is not None else None
+        bounds = _view_bounds(G_proj, point, ax, distance)
+        water = _prepared(water, crs, bounds, tol, shared_cache)
+        parks = _prepared(parks, crs, bounds, tol, shared_cache)
         
         # Plot water
         if water is not None and not water.empty:
-            water_polys = water[water.geometry.type.isin(["Polygon", "MultiPolygon"])]
-            if not water_polys.empty:
-                try:
-                    water_polys = ox.projection.project_gdf(water_polys)
-                except Exception:
-                    water_polys = water_polys.to_crs(G_proj.graph["crs"])
-                water_polys.plot(
-                    ax=ax, facecolor=theme.get("water", "#A8D5F0"),
-                    edgecolor="none", zorder=1
-                )
+            _add_polygons(
+                ax, water, shared_cache, facecolor=theme.get("water", "#A8D5F0"),
+                edgecolor="none", zorder=1
+            )
         
         # Plot parks
         if parks is not None and not parks.empty:
-            parks_polys = parks[parks.geometry.type.isin(["Polygon", "MultiPolygon"])]
-            if not parks_polys.empty:
-                try:
-                    parks_polys = ox.projection.project_gdf(parks_polys)
-                except Exception:
-                    parks_polys = parks_polys.to_crs(G_proj.graph["crs"])
-                parks_polys.plot(
-                    ax=ax, facecolor=theme.get("parks", "#C8E6C9"),
-                    edgecolor="none", zorder=2
-                )
+            _add_polygons(
+                ax, parks, shared_cache, facecolor=theme.get("parks", "#C8E6C9"),
+                edgecolor="none", zorder=2
+            )
         
         # Plot roads
+        from create_map_poster import get_edge_colors_by_type, get_edge_widths_by_type
+
         edge_colors = get_edge_colors_by_type(G_proj)
         edge_widths = get_edge_widths_by_type(G_proj)
         
-        ox.plot_graph(
-            G_proj,
-            ax=ax,
+        _add_graph_edges(
+            ax, G_proj, point, distance, shared_cache,
+            color=edge_colors,
+            linewidth=edge_widths,
             bgcolor=theme.get("bg", "#FFFFFF"),
-            node_size=0,
-            edge_color=edge_colors,
-            edge_linewidth=edge_widths,
-            show=False,
-            close=False,
         )
     
+    render.fetch = fetch
     return render
 
 
@@ -138,6 +561,7 @@ def create_railway_layer_renderer(
     distance: float,
     theme: dict,
     include_roads: bool = True,
+    shared_cache: Optional[dict] = None,
 ):
     """
     Create a render function for railway layer.
@@ -147,78 +571,87 @@ def create_railway_layer_renderer(
         distance: Viewport distance in meters
         theme: Color theme dictionary
         include_roads: Whether to include light road background
+        shared_cache: Fetch results shared between layers of one composition
         
     Returns:
-        Render function for LayerCompositor
+        Render function for LayerCompositor (its .fetch fills layer_data only)
     """
-    def render(ax: Axes, layer_data: dict):
+    if shared_cache is None:
+        shared_cache = {}
+    
+    def fetch(layer_data: LayerData):
+        """Fetch railway layer data if not cached."""
+        if fetch_railways is None:
+            return
+        fetchers = {
+            'railways': _provider_fetch('railways', fetch_railways, point, distance),
+            'water': _features_fetch(point, distance, WATER_TAGS, "water"),
+        }
+        if include_roads:
+            fetchers['graph'] = _graph_fetch(point, distance)
+        _fetch_missing(layer_data, fetchers, shared_cache)
+    
+    def render(ax: Axes, layer_data: LayerData):
         """Render railway layer to axes."""
         if fetch_railways is None:
             ax.text(0.5, 0.5, 'Railway provider not available',
                    ha='center', va='center', transform=ax.transAxes)
             return
         
-        # Fetch data if not cached
-        if 'railways' not in layer_data:
-            layer_data['railways'] = fetch_railways(point, distance)
-            if include_roads:
-                layer_data['graph'] = fetch_graph(point, distance)
-            layer_data['water'] = fetch_features(
-                point, distance,
-                tags={"natural": "water", "waterway": "riverbank"},
-                name="water"
-            )
+        fetch(layer_data)
+        
+        railways = layer_data.railways
+        G = layer_data.graph
+        water = layer_data.water
         
-        railways = layer_data.get('railways')
-        G = layer_data.get('graph')
-        water = layer_data.get('water')
+        # Project, clip and simplify once; every layer of the composition reuses it
+        G_proj = _get_projected_graph(G, shared_cache) if G is not None else None
+        crs = G_proj.graph["crs"] if G_proj is not None else None
+        tol = _simplify_tolerance(ax, distance) if crs is not None else None
+        bounds = (
+            _view_bounds(G_proj, point, ax, distance) if G_proj is not None else None
+        )
+        water = _prepared(water, crs, bounds, tol, shared_cache)
+        railways = _prepared(railways, crs, bounds, tol, shared_cache)
         
         # Plot water for context
         if water is not None and not water.empty:
-            water_polys = water[water.geometry.type.isin(["Polygon", "MultiPolygon"])]
-            if not water_polys.empty:
-                water_polys.plot(
-                    ax=ax, facecolor=theme.get("water", "#A8D5F0"),
-                    edgecolor="none", zorder=1
-                )
+            _add_polygons(
+                ax, water, shared_cache, facecolor=theme.get("water", "#A8D5F0"),
+                edgecolor="none", zorder=1
+            )
         
         # Light road background
-        if include_roads and G is not None:
-            G_proj = ox.project_graph(G)
-            ox.plot_graph(
-                G_proj,
-                ax=ax,
+        if include_roads and G_proj is not None:
+            _add_graph_edges(
+                ax, G_proj, point, distance, shared_cache,
+                color="#DDDDDD",
+                linewidth=0.3,
                 bgcolor=theme.get("bg", "#FFFFFF"),
-                node_size=0,
-                edge_color="#DDDDDD",
-                edge_linewidth=0.3,
-                show=False,
-                close=False,
             )
         
         # Plot railways prominently
         if railways is not None and not railways.empty:
-            railway_lines = railways[railways.geometry.type.isin(["LineString", "MultiLineString"])]
-            if not railway_lines.empty:
-                railway_color = theme.get("railway", "#8B4513")
-                railway_lines.plot(
-                    ax=ax,
-                    color=railway_color,
-                    linewidth=2.5,
-                    zorder=5,
-                )
-                
-                # Add railway stations if available
-                if 'railway' in railways.columns:
-                    stations = railways[railways['railway'] == 'station']
-                    if not stations.empty:
-                        stations.plot(
-                            ax=ax,
-                            color=railway_color,
-                            markersize=50,
-                            zorder=6,
-                        )
+            railway_color = theme.get("railway", "#8B4513")
+            drawn = _add_lines(
+                ax, railways, shared_cache,
+                color=railway_color,
+                linewidth=2.5,
+                zorder=5,
+            )
+            
+            # Add railway stations if available
+            if drawn and 'railway' in railways.columns:
+                stations = railways[railways['railway'] == 'station']
+                if not stations.empty:
+                    stations.plot(
+                        ax=ax,
+                        color=railway_color,
+                        markersize=50,
+                        zorder=6,
+                    )
     
+    render.fetch = fetch
     return render
 
 
@@ -227,6 +660,7 @@ def create_cycling_layer_renderer(
     distance: float,
     theme: dict,
     include_roads: bool = True,
+    shared_cache: Optional[dict] = None,
 ):
     """
     Create a render function for cycling routes layer.
@@ -236,81 +670,91 @@ def create_cycling_layer_renderer(
         distance: Viewport distance in meters
         theme: Color theme dictionary
         include_roads: Whether to include light road background
+        shared_cache: Fetch results shared between layers of one composition
         
     Returns:
-        Render function for LayerCompositor
+        Render function for LayerCompositor (its .fetch fills layer_data only)
     """
-    def render(ax: Axes, layer_data: dict):
+    if shared_cache is None:
+        shared_cache = {}
+    
+    def fetch(layer_data: LayerData):
+        """Fetch cycling layer data if not cached."""
+        if fetch_cycling_routes is None:
+            return
+        fetchers = {
+            'cycling': _provider_fetch('cycling', fetch_cycling_routes, point, distance),
+            'water': _features_fetch(point, distance, WATER_TAGS, "water"),
+        }
+        if include_roads:
+            fetchers['graph'] = _graph_fetch(point, distance)
+        _fetch_missing(layer_data, fetchers, shared_cache)
+    
+    def render(ax: Axes, layer_data: LayerData):
         """Render cycling layer to axes."""
         if fetch_cycling_routes is None:
             ax.text(0.5, 0.5, 'Cycling provider not available',
                    ha='center', va='center', transform=ax.transAxes)
             return
         
-        # Fetch data if not cached
-        if 'cycle_routes' not in layer_data:
-            cycle_routes, cycleways = fetch_cycling_routes(point, distance)
-            layer_data['cycle_routes'] = cycle_routes
-            layer_data['cycleways'] = cycleways
-            if include_roads:
-                layer_data['graph'] = fetch_graph(point, distance)
-            layer_data['water'] = fetch_features(
-                point, distance,
-                tags={"natural": "water", "waterway": "riverbank"},
-                name="water"
-            )
+        fetch(layer_data)
         
-        cycle_routes = layer_data.get('cycle_routes')
-        cycleways = layer_data.get('cycleways')
-        G = layer_data.get('graph')
-        water = layer_data.get('water')
+        cycling = layer_data.cycling
+        if isinstance(cycling, tuple):
+            cycle_routes, cycleways = cycling
+        else:
+            # Provider returns the combined bike infrastructure only
+            cycle_routes, cycleways = None, cycling
+        G = layer_data.graph
+        water = layer_data.water
+        
+        # Project, clip and simplify once; every layer of the composition reuses it
+        G_proj = _get_projected_graph(G, shared_cache) if G is not None else None
+        crs = G_proj.graph["crs"] if G_proj is not None else None
+        tol = _simplify_tolerance(ax, distance) if crs is not None else None
+        bounds = (
+            _view_bounds(G_proj, point, ax, distance) if G_proj is not None else None
+        )
+        water = _prepared(water, crs, bounds, tol, shared_cache)
+        cycle_routes = _prepared(cycle_routes, crs, bounds, tol, shared_cache)
+        cycleways = _prepared(cycleways, crs, bounds, tol, shared_cache)
         
         # Plot water for context
         if water is not None and not water.empty:
-            water_polys = water[water.geometry.type.isin(["Polygon", "MultiPolygon"])]
-            if not water_polys.empty:
-                water_polys.plot(
-                    ax=ax, facecolor=theme.get("water", "#A8D5F0"),
-                    edgecolor="none", zorder=1
-                )
+            _add_polygons(
+                ax, water, shared_cache, facecolor=theme.get("water", "#A8D5F0"),
+                edgecolor="none", zorder=1
+            )
         
         # Light road background
-        if include_roads and G is not None:
-            G_proj = ox.project_graph(G)
-            ox.plot_graph(
-                G_proj,
-                ax=ax,
+        if include_roads and G_proj is not None:
+            _add_graph_edges(
+                ax, G_proj, point, distance, shared_cache,
+                color="#E0E0E0",
+                linewidth=0.3,
                 bgcolor=theme.get("bg", "#FFFFFF"),
-                node_size=0,
-                edge_color="#E0E0E0",
-                edge_linewidth=0.3,
-                show=False,
-                close=False,
             )
         
         # Plot cycleways (dedicated bike paths)
         if cycleways is not None and not cycleways.empty:
-            cycleway_lines = cycleways[cycleways.geometry.type.isin(["LineString", "MultiLineString"])]
-            if not cycleway_lines.empty:
-                cycleway_lines.plot(
-                    ax=ax,
-                    color=theme.get("cycleway", "#4CAF50"),
-                    linewidth=2.0,
-                    zorder=4,
-                )
+            _add_lines(
+                ax, cycleways, shared_cache,
+                color=theme.get("cycleway", "#4CAF50"),
+                linewidth=2.0,
+                zorder=4,
+            )
         
         # Plot cycle routes (marked bike routes on roads)
         if cycle_routes is not None and not cycle_routes.empty:
-            route_lines = cycle_routes[cycle_routes.geometry.type.isin(["LineString", "MultiLineString"])]
-            if not route_lines.empty:
-                route_lines.plot(
-                    ax=ax,
-                    color=theme.get("cycle_route", "#FF9800"),
-                    linewidth=2.5,
-                    linestyle='--',
-                    zorder=5,
-                )
+            _add_lines(
+                ax, cycle_routes, shared_cache,
+                color=theme.get("cycle_route", "#FF9800"),
+                linewidth=2.5,
+                linestyle='--',
+                zorder=5,
+            )
     
+    render.fetch = fetch
     return render
 
 
@@ -319,6 +763,7 @@ def create_transit_layer_renderer(
     distance: float,
     theme: dict,
     include_roads: bool = True,
+    shared_cache: Optional[dict] = None,
 ):
     """
     Create a render function for public transit layer.
@@ -328,55 +773,64 @@ def create_transit_layer_renderer(
         distance: Viewport distance in meters
         theme: Color theme dictionary
         include_roads: Whether to include light road background
+        shared_cache: Fetch results shared between layers of one composition
         
     Returns:
-        Render function for LayerCompositor
+        Render function for LayerCompositor (its .fetch fills layer_data only)
     """
-    def render(ax: Axes, layer_data: dict):
+    # Use existing fetch_transit; resolved once here, not on every fetch
+    from create_map_poster import fetch_transit
+
+    if shared_cache is None:
+        shared_cache = {}
+    
+    def fetch(layer_data: LayerData):
+        """Fetch transit layer data if not cached."""
+        fetchers = {
+            'transit': _provider_fetch('transit', fetch_transit, point, distance),
+            'water': _features_fetch(point, distance, WATER_TAGS, "water"),
+        }
+        if include_roads:
+            fetchers['graph'] = _graph_fetch(point, distance)
+        _fetch_missing(layer_data, fetchers, shared_cache)
+    
+    def render(ax: Axes, layer_data: LayerData):
         """Render transit layer to axes."""
-        # Fetch data if not cached
-        if 'transit' not in layer_data:
-            # Use existing fetch_transit if available
-            from create_map_poster import fetch_transit
-            layer_data['transit'] = fetch_transit(point, distance)
-            if include_roads:
-                layer_data['graph'] = fetch_graph(point, distance)
-            layer_data['water'] = fetch_features(
-                point, distance,
-                tags={"natural": "water", "waterway": "riverbank"},
-                name="water"
-            )
+        fetch(layer_data)
         
-        transit = layer_data.get('transit')
-        G = layer_data.get('graph')
-        water = layer_data.get('water')
+        transit = layer_data.transit
+        G = layer_data.graph
+        water = layer_data.water
+        
+        # Project, clip and simplify once; every layer of the composition reuses it
+        G_proj = _get_projected_graph(G, shared_cache) if G is not None else None
+        crs = G_proj.graph["crs"] if G_proj is not None else None
+        tol = _simplify_tolerance(ax, distance) if crs is not None else None
+        bounds = (
+            _view_bounds(G_proj, point, ax, distance) if G_proj is not None else None
+        )
+        water = _prepared(water, crs, bounds, tol, shared_cache)
+        transit = _prepared(transit, crs, bounds, tol, shared_cache)
         
         # Plot water for context
         if water is not None and not water.empty:
-            water_polys = water[water.geometry.type.isin(["Polygon", "MultiPolygon"])]
-            if not water_polys.empty:
-                water_polys.plot(
-                    ax=ax, facecolor=theme.get("water", "#A8D5F0"),
-                    edgecolor="none", zorder=1
-                )
+            _add_polygons(
+                ax, water, shared_cache, facecolor=theme.get("water", "#A8D5F0"),
+                edgecolor="none", zorder=1
+            )
         
         # Light road background
-        if include_roads and G is not None:
-            G_proj = ox.project_graph(G)
-            ox.plot_graph(
-                G_proj,
-                ax=ax,
+        if include_roads and G_proj is not None:
+            _add_graph_edges(
+                ax, G_proj, point, distance, shared_cache,
+                color="#E8E8E8",
+                linewidth=0.3,
                 bgcolor=theme.get("bg", "#FFFFFF"),
-                node_size=0,
-                edge_color="#E8E8E8",
-                edge_linewidth=0.3,
-                show=False,
-                close=False,
             )
         
         # Plot transit lines
         if transit is not None and not transit.empty:
-            transit_lines = transit[transit.geometry.type.isin(["LineString", "MultiLineString"])]
+            transit_lines = _lines(transit)
             if not transit_lines.empty:
                 # Color by transit type if available
                 if 'route_type' in transit_lines.columns:
@@ -387,35 +841,42 @@ def create_transit_layer_renderer(
                         'bus': theme.get("transit_bus", "#FF5722"),
                         'train': theme.get("transit_train", "#9C27B0"),
                     }
-                    for route_type, color in type_colors.items():
-                        lines = transit_lines[transit_lines['route_type'] == route_type]
-                        if not lines.empty:
-                            lines.plot(
-                                ax=ax,
-                                color=color,
-                                linewidth=3.0,
-                                zorder=5,
-                            )
+                    # One collection for all types: unlisted types are
+                    # skipped and types stack in type_colors order
+                    rank = {route_type: i for i, route_type in enumerate(type_colors)}
+                    codes = transit_lines['route_type'].map(rank).fillna(-1).to_numpy(int)
+                    order = np.argsort(codes, kind="stable")
+                    order = order[codes[order] >= 0]
+                    if len(order):
+                        palette = np.array(list(type_colors.values()))
+                        _add_colored_lines(
+                            ax, transit_lines.iloc[order],
+                            palette[codes[order]],
+                            linewidth=3.0,
+                            zorder=5,
+                        )
                 else:
                     # Single color for all transit
-                    transit_lines.plot(
-                        ax=ax,
+                    _add_lines(
+                        ax, transit_lines, None,
                         color=theme.get("transit", "#E91E63"),
                         linewidth=3.0,
                         zorder=5,
                     )
             
             # Plot transit stops
-            stops = transit[transit.geometry.type == 'Point']
+            stops = _points(transit)
             if not stops.empty:
-                stops.plot(
-                    ax=ax,
-                    color=theme.get("transit_stop", "#FFFFFF"),
-                    edgecolor=theme.get("transit", "#E91E63"),
-                    markersize=30,
+                xy = shapely.get_coordinates(stops.geometry.values)
+                ax.scatter(
+                    xy[:, 0], xy[:, 1],
+                    s=30,
+                    c=theme.get("transit_stop", "#FFFFFF"),
+                    edgecolors=theme.get("transit", "#E91E63"),
                     zorder=6,
                 )
     
+    render.fetch = fetch
     return render
 
 
@@ -424,6 +885,7 @@ def create_maritime_layer_renderer(
     distance: float,
     theme: dict,
     include_coastline: bool = True,
+    shared_cache: Optional[dict] = None,
 ):
     """
     Create a render function for maritime/coastal layer.
@@ -433,72 +895,186 @@ def create_maritime_layer_renderer(
         distance: Viewport distance in meters
         theme: Color theme dictionary
         include_coastline: Whether to emphasize coastline
+        shared_cache: Fetch results shared between layers of one composition
         
     Returns:
-        Render function for LayerCompositor
+        Render function for LayerCompositor (its .fetch fills layer_data only)
     """
-    def render(ax: Axes, layer_data: dict):
-        """Render maritime layer to axes."""
-        # Fetch data if not cached
-        if 'water' not in layer_data:
-            layer_data['water'] = fetch_features(
-                point, distance,
-                tags={"natural": "water", "waterway": "riverbank", "place": "sea"},
-                name="water"
+    if shared_cache is None:
+        shared_cache = {}
+    
+    def fetch(layer_data: LayerData):
+        """Fetch maritime layer data if not cached."""
+        fetchers = {
+            'water': _features_fetch(point, distance, SEA_TAGS, "water"),
+            'graph': _graph_fetch(point, distance),
+        }
+        if include_coastline:
+            fetchers['coastline'] = _features_fetch(
+                point, distance, COASTLINE_TAGS, "coastline"
             )
-            if include_coastline:
-                layer_data['coastline'] = fetch_features(
-                    point, distance,
-                    tags={"natural": "coastline"},
-                    name="coastline"
-                )
-            layer_data['graph'] = fetch_graph(point, distance)
+        _fetch_missing(layer_data, fetchers, shared_cache)
+    
+    def render(ax: Axes, layer_data: LayerData):
+        """Render maritime layer to axes."""
+        fetch(layer_data)
         
-        water = layer_data.get('water')
-        coastline = layer_data.get('coastline')
-        G = layer_data.get('graph')
+        water = layer_data.water
+        coastline = layer_data.coastline
+        G = layer_data.graph
+        
+        # Project, clip and simplify once; every layer of the composition reuses it
+        G_proj = _get_projected_graph(G, shared_cache) if G is not None else None
+        crs = G_proj.graph["crs"] if G_proj is not None else None
+        tol = _simplify_tolerance(ax, distance) if crs is not None else None
+        bounds = (
+            _view_bounds(G_proj, point, ax, distance) if G_proj is not None else None
+        )
+        water = _prepared(water, crs, bounds, tol, shared_cache)
+        # Coastline is the focal feature here, so keep more of its detail
+        coast_tol = tol / 3 if tol is not None else None
+        coastline = _prepared(coastline, crs, bounds, coast_tol, shared_cache)
         
         # Plot water areas
         if water is not None and not water.empty:
-            water_polys = water[water.geometry.type.isin(["Polygon", "MultiPolygon"])]
-            if not water_polys.empty:
-                water_polys.plot(
-                    ax=ax,
-                    facecolor=theme.get("water", "#4A90E2"),
-                    edgecolor=theme.get("water_edge", "#2E5C8A"),
-                    linewidth=1.0,
-                    zorder=1,
-                )
+            _add_polygons(
+                ax, water, shared_cache,
+                facecolor=theme.get("water", "#4A90E2"),
+                edgecolor=theme.get("water_edge", "#2E5C8A"),
+                linewidth=1.0,
+                zorder=1,
+            )
         
         # Plot coastline prominently
         if coastline is not None and not coastline.empty:
-            coastline_lines = coastline[coastline.geometry.type.isin(["LineString", "MultiLineString"])]
-            if not coastline_lines.empty:
-                coastline_lines.plot(
-                    ax=ax,
-                    color=theme.get("coastline", "#1A5276"),
-                    linewidth=3.0,
-                    zorder=4,
-                )
+            _add_lines(
+                ax, coastline, shared_cache,
+                color=theme.get("coastline", "#1A5276"),
+                linewidth=3.0,
+                zorder=4,
+            )
         
         # Plot city streets (for coastal cities)
-        if G is not None:
-            G_proj = ox.project_graph(G)
+        if G_proj is not None:
             # Use lighter colors for land features
-            ox.plot_graph(
-                G_proj,
-                ax=ax,
+            _add_graph_edges(
+                ax, G_proj, point, distance, shared_cache,
+                color=theme.get("street_light", "#D0D0D0"),
+                linewidth=0.4,
                 bgcolor=theme.get("bg", "#F5F5F5"),
-                node_size=0,
-                edge_color=theme.get("street_light", "#D0D0D0"),
-                edge_linewidth=0.4,
-                show=False,
-                close=False,
             )
     
+    render.fetch = fetch
     return render
 
 
+_RENDER_CREATORS = {
+    'city': create_city_layer_renderer,
+    'railway': create_railway_layer_renderer,
+    'cycling': create_cycling_layer_renderer,
+    'transit': create_transit_layer_renderer,
+    'maritime': create_maritime_layer_renderer,
+}
+
+
+class _LayerRenderer:
+    """
+    Render function for one layer type that survives pickling, so the
+    compositor can hand it to a spawned render worker. It pickles as its
+    constructor arguments and rebuilds the closure on the other side; the
+    shared cache stays behind, since the worker receives already-fetched
+    layer data and only re-derives projections from it. The city layer's road
+    colours come from create_map_poster's global THEME, which a spawned
+    worker starts without, so that travels along too.
+    """
+
+    __slots__ = ("_args", "_render")
+
+    def __init__(self, layer_type, point, distance, theme, fig_size, shared_cache):
+        self._args = (layer_type, point, distance, theme, fig_size)
+        if layer_type == 'city':
+            self._render = create_city_layer_renderer(
+                point, distance, theme, fig_size, shared_cache=shared_cache
+            )
+        else:
+            self._render = _RENDER_CREATORS[layer_type](
+                point, distance, theme, shared_cache=shared_cache
+            )
+
+    def __call__(self, ax: Axes, layer_data: LayerData):
+        self._render(ax, layer_data)
+
+    def fetch(self, layer_data: LayerData):
+        self._render.fetch(layer_data)
+
+    def __reduce__(self):
+        poster_theme = None
+        if self._args[0] == 'city':
+            from create_map_poster import THEME
+            poster_theme = dict(THEME)
+        return (_rebuild_layer_renderer, (self._args, poster_theme))
+
+
+def _rebuild_layer_renderer(args, poster_theme):
+    """Unpickle a _LayerRenderer, restoring the poster THEME it relies on."""
+    if poster_theme:
+        import create_map_poster
+
+        create_map_poster.THEME.update(poster_theme)
+    return _LayerRenderer(*args, {})
+
+
+def _make_renderer(
+    layer_type: str,
+    point: Point,
+    distance: float,
+    theme: dict,
+    fig_size: tuple[float, float],
+    shared_cache: dict,
+):
+    """Create the (picklable) render function for layer_type."""
+    return _LayerRenderer(layer_type, point, distance, theme, fig_size, shared_cache)
+
+
+@dataclass(frozen=True, slots=True)
+class LayerSpec:
+    """
+    Immutable description of one layer in a composition.
+
+    Attributes:
+        name: Unique identifier for the layer
+        layer_type: Type of map data (city, railway, cycling, transit, maritime)
+        opacity: Layer opacity (0.0 - 1.0)
+        blend_mode: How this layer blends with layers below
+        z_index: Stack order (None = on top of existing layers)
+        theme_overrides: Optional theme color overrides (not part of the hash)
+    """
+
+    name: str
+    layer_type: str
+    opacity: float = 1.0
+    blend_mode: BlendMode = BlendMode.NORMAL
+    z_index: Optional[int] = None
+    theme_overrides: dict = field(default_factory=dict, hash=False, compare=False)
+
+    @classmethod
+    def from_config(cls, config: Union["LayerSpec", dict]) -> "LayerSpec":
+        """Adapt a dict-style layer config (blend_mode may be a string)."""
+        if isinstance(config, cls):
+            return config
+        blend_mode = config.get('blend_mode', BlendMode.NORMAL)
+        if isinstance(blend_mode, str):
+            blend_mode = BlendMode(blend_mode)
+        return cls(
+            name=config['name'],
+            layer_type=config['layer_type'],
+            opacity=config.get('opacity', 1.0),
+            blend_mode=blend_mode,
+            z_index=config.get('z_index'),
+            theme_overrides=config.get('theme_overrides') or {},
+        )
+
+
 def build_layered_composition(
     city: str,
     country: str,
@@ -506,9 +1082,10 @@ def build_layered_composition(
     distance: float,
     width: int,
     height: int,
-    layers_config: list[dict],
+    layers_config: Sequence[Union[LayerSpec, dict]],
     theme: dict,
     output_file: Optional[str] = None,
+    max_workers: Optional[int] = None,
 ) -> 'LayerCompositor':
     """
     Build a layered map composition with multiple overlay types.
@@ -520,14 +1097,16 @@ def build_layered_composition(
         distance: Viewport distance in meters
         width: Output width in inches
         height: Output height in inches
-        layers_config: List of layer configuration dicts
+        layers_config: LayerSpecs (or equivalent dicts) describing each layer
         theme: Color theme dictionary
         output_file: Optional output file path
+        max_workers: Processes rendering the layers in parallel on export
+            (default: CPU count; 1 renders serially)
         
     Returns:
         Configured LayerCompositor instance
     """
-    from map_layer_compositor import LayerCompositor, BlendMode
+    from map_layer_compositor import LayerCompositor
     
     # Calculate DPI based on typical poster resolution
     dpi = 150
@@ -537,43 +1116,56 @@ def build_layered_composition(
     compositor = LayerCompositor(
         width=pixel_width,
         height=pixel_height,
-        dpi=dpi
+        dpi=dpi,
+        max_workers=max_workers,
     )
     
-    # Map layer types to their render function creators
-    render_creators = {
-        'city': lambda: create_city_layer_renderer(point, distance, theme, (width, height)),
-        'railway': lambda: create_railway_layer_renderer(point, distance, theme),
-        'cycling': lambda: create_cycling_layer_renderer(point, distance, theme),
-        'transit': lambda: create_transit_layer_renderer(point, distance, theme),
-        'maritime': lambda: create_maritime_layer_renderer(point, distance, theme),
-    }
+    # Layers of one composition share fetched OSM data, so e.g. the graph and
+    # water polygons are downloaded once rather than once per layer
+    shared_cache: dict = {}
     
-    # Add each layer
-    for config in layers_config:
-        layer_type = config['layer_type']
-        
-        if layer_type not in render_creators:
-            logger.warning(f"Unknown layer type: {layer_type}")
+    specs = []
+    for spec in map(LayerSpec.from_config, layers_config):
+        if spec.layer_type not in _RENDER_CREATORS:
+            logger.warning(f"Unknown layer type: {spec.layer_type}")
             continue
+        specs.append(spec)
+    
+    # An opaque, normal-blend bottom layer can draw straight onto the canvas
+    bottom = min(
+        specs, key=lambda s: (s.z_index is None, s.z_index or 0), default=None
+    )
+    if bottom is not None and (
+        bottom.opacity < 1.0 or bottom.blend_mode != BlendMode.NORMAL
+    ):
+        bottom = None
+    
+    # Add each layer
+    for spec in specs:
+        layer_type = spec.layer_type
         
         # Create render function
-        render_func = render_creators[layer_type]()
-        
-        # Parse blend mode
-        blend_mode = config.get('blend_mode', BlendMode.NORMAL)
-        if isinstance(blend_mode, str):
-            blend_mode = BlendMode(blend_mode)
+        render_func = _make_renderer(
+            layer_type, point, distance, theme, (width, height), shared_cache
+        )
         
         # Add layer to compositor
-        layer = compositor.add_layer(
-            name=config['name'],
-            layer_type=layer_type,
-            opacity=config.get('opacity', 1.0),
-            blend_mode=blend_mode,
-            z_index=config.get('z_index'),
-            theme_overrides=config.get('theme_overrides', {}),
-        )
+        if spec is bottom:
+            layer = compositor.add_base_layer(
+                name=spec.name,
+                layer_type=layer_type,
+                z_index=spec.z_index or 0,
+                theme_overrides=dict(spec.theme_overrides),
+            )
+        else:
+            layer = compositor.add_layer(
+                name=spec.name,
+                layer_type=layer_type,
+                opacity=spec.opacity,
+                blend_mode=spec.blend_mode,
+                z_index=spec.z_index,
+                theme_overrides=dict(spec.theme_overrides),
+            )
         
         # Attach render function
         layer.render_func = render_func
@@ -587,28 +1179,28 @@ def build_layered_composition(
 
 
 # Predefined layer combinations for common use cases
-LAYER_PRESETS = {
-    'city_railway_overlay': [
-        {'name': 'city_base', 'layer_type': 'city', 'opacity': 1.0, 'blend_mode': 'normal', 'z_index': 0},
-        {'name': 'railway_overlay', 'layer_type': 'railway', 'opacity': 0.9, 'blend_mode': 'multiply', 'z_index': 1},
-    ],
-    'cycling_highlight': [
-        {'name': 'city_faded', 'layer_type': 'city', 'opacity': 0.5, 'blend_mode': 'normal', 'z_index': 0},
-        {'name': 'cycling_highlight', 'layer_type': 'cycling', 'opacity': 1.0, 'blend_mode': 'screen', 'z_index': 1},
-    ],
-    'transit_focus': [
-        {'name': 'city_subtle', 'layer_type': 'city', 'opacity': 0.3, 'blend_mode': 'multiply', 'z_index': 0},
-        {'name': 'transit_lines', 'layer_type': 'transit', 'opacity': 1.0, 'blend_mode': 'normal', 'z_index': 1},
-    ],
-    'coastal_city': [
-        {'name': 'city_land', 'layer_type': 'city', 'opacity': 0.7, 'blend_mode': 'normal', 'z_index': 0},
-        {'name': 'maritime_water', 'layer_type': 'maritime', 'opacity': 0.8, 'blend_mode': 'overlay', 'z_index': 1},
-    ],
-    'triple_transit': [
-        {'name': 'city_base', 'layer_type': 'city', 'opacity': 0.4, 'blend_mode': 'normal', 'z_index': 0},
-        {'name': 'railway_layer', 'layer_type': 'railway', 'opacity': 0.7, 'blend_mode': 'multiply', 'z_index': 1},
-        {'name': 'transit_layer', 'layer_type': 'transit', 'opacity': 0.9, 'blend_mode': 'screen', 'z_index': 2},
-    ],
+LAYER_PRESETS: dict[str, tuple[LayerSpec, ...]] = {
+    'city_railway_overlay': (
+        LayerSpec('city_base', 'city', opacity=1.0, blend_mode=BlendMode.NORMAL, z_index=0),
+        LayerSpec('railway_overlay', 'railway', opacity=0.9, blend_mode=BlendMode.MULTIPLY, z_index=1),
+    ),
+    'cycling_highlight': (
+        LayerSpec('city_faded', 'city', opacity=0.5, blend_mode=BlendMode.NORMAL, z_index=0),
+        LayerSpec('cycling_highlight', 'cycling', opacity=1.0, blend_mode=BlendMode.SCREEN, z_index=1),
+    ),
+    'transit_focus': (
+        LayerSpec('city_subtle', 'city', opacity=0.3, blend_mode=BlendMode.MULTIPLY, z_index=0),
+        LayerSpec('transit_lines', 'transit', opacity=1.0, blend_mode=BlendMode.NORMAL, z_index=1),
+    ),
+    'coastal_city': (
+        LayerSpec('city_land', 'city', opacity=0.7, blend_mode=BlendMode.NORMAL, z_index=0),
+        LayerSpec('maritime_water', 'maritime', opacity=0.8, blend_mode=BlendMode.OVERLAY, z_index=1),
+    ),
+    'triple_transit': (
+        LayerSpec('city_base', 'city', opacity=0.4, blend_mode=BlendMode.NORMAL, z_index=0),
+        LayerSpec('railway_layer', 'railway', opacity=0.7, blend_mode=BlendMode.MULTIPLY, z_index=1),
+        LayerSpec('transit_layer', 'transit', opacity=0.9, blend_mode=BlendMode.SCREEN, z_index=2),
+    ),
 }
 
 
@@ -622,6 +1214,7 @@ def create_preset_layered_map(
     height: int = 16,
     theme: Optional[dict] = None,
     output_file: Optional[str] = None,
+    max_workers: Optional[int] = None,
 ):
     """
     Create a layered map using a predefined preset.
@@ -636,6 +1229,7 @@ def create_preset_layered_map(
         height: Output height in inches
         theme: Optional color theme (uses default if None)
         output_file: Optional output file path
+        max_workers: Layer render processes (see build_layered_composition)
         
     Returns:
         LayerCompositor instance
@@ -674,4 +1268,5 @@ def create_preset_layered_map(
         layers_config=layers_config,
         theme=theme,
         output_file=output_file,
+        max_workers=max_workers,
     )
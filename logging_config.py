@@ -1,22 +1,37 @@
 import logging
 import os
 from datetime import datetime
+from logging.handlers import RotatingFileHandler
+
+LOG_MAX_BYTES = 10 * 1024 * 1024
+LOG_BACKUP_COUNT = 3
 
 
 def setup_logger():
     """
     Setup a logger that prints to both file and console.
+
+    Idempotent: a re-import (or worker process re-running this) returns the
+    already configured logger instead of attaching duplicate handlers.
     """
+    logger = logging.getLogger("map_art_generator")
+    if logger.handlers:
+        return logger
+
+    logger.setLevel(logging.DEBUG)
+    # Don't emit every record a second time through the root logger
+    logger.propagate = False
+
     if not os.path.exists("logs"):
         os.makedirs("logs")
 
     log_filename = os.path.join("logs", f"app_{datetime.now().strftime('%Y%m%d')}.log")
 
-    logger = logging.getLogger("map_art_generator")
-    logger.setLevel(logging.DEBUG)
-
     # Create handlers
-    file_handler = logging.FileHandler(log_filename)
+    # Rotated so a long-running app can't grow the log without bound
+    file_handler = RotatingFileHandler(
+        log_filename, maxBytes=LOG_MAX_BYTES, backupCount=LOG_BACKUP_COUNT
+    )
     console_handler = logging.StreamHandler()
 
     # Create formatters and add them to handlers
@@ -0,0 +1,76 @@
+"""
+Disk cache for the map providers' OpenStreetMap feature queries.
+
+Entries are pickles in the same directory create_map_poster caches to
+(CACHE_DIR, default .cache), named osm_<blake2b digest of the query>.pkl,
+so a repeated query skips both the Overpass round-trip and its rate-limit
+sleep.
+"""
+
+import hashlib
+import json
+import os
+import pickle
+import tempfile
+import time
+from pathlib import Path
+
+__all__ = ["CACHE_DIR", "clear_osm_cache", "features_from_point"]
+
+CACHE_DIR = Path(os.environ.get("CACHE_DIR", ".cache"))
+CACHE_PREFIX = "osm_"
+
+# Seconds to wait after each uncached Overpass request
+RATE_LIMIT_DELAY = 0.3
+
+
+def _query_key(point, tags: dict, dist) -> str:
+    """
+    Cache key for one query. Coordinates are rounded to 4 decimals (~11 m)
+    so the same place typed twice shares an entry.
+    """
+    lat, lon = point
+    query = json.dumps(
+        [round(lat, 4), round(lon, 4), dist, tags], sort_keys=True, default=str
+    )
+    return hashlib.blake2b(query.encode(), digest_size=16).hexdigest()
+
+
+def features_from_point(point, tags: dict, dist):
+    """
+    ox.features_from_point through the disk cache. Failures raise as
+    before and are not cached.
+    """
+    path = CACHE_DIR / f"{CACHE_PREFIX}{_query_key(point, tags, dist)}.pkl"
+    try:
+        with open(path, "rb") as f:
+            return pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError):
+        pass
+
+    import osmnx as ox  # Heavy; only needed on a cache miss
+
+    features = ox.features_from_point(point, tags=tags, dist=dist)
+    time.sleep(RATE_LIMIT_DELAY)
+    try:
+        CACHE_DIR.mkdir(exist_ok=True)
+        # Write then rename, so a concurrent reader never sees half a file
+        fd, tmp_path = tempfile.mkstemp(dir=CACHE_DIR, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump(features, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        print(f"[!] Could not cache OSM features: {e}")
+    return features
+
+
+def clear_osm_cache() -> int:
+    """Delete the cached provider queries. Returns the number removed."""
+    removed = 0
+    for path in CACHE_DIR.glob(f"{CACHE_PREFIX}*.pkl"):
+        try:
+            path.unlink()
+            removed += 1
+        except OSError:
+            pass
+    return removed
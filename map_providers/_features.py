@@ -0,0 +1,60 @@
+"""Shared OSM feature fetching for the map providers."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from map_providers._cache import features_from_point
+
+if TYPE_CHECKING:
+    from geopandas import GeoDataFrame
+
+__all__ = ["fetch_tag_groups", "merge_tags", "tag_mask"]
+
+
+def merge_tags(groups: dict[str, dict]) -> dict:
+    """Union of several OSM tag filters into one Overpass filter."""
+    merged: dict = {}
+    for tags in groups.values():
+        for key, value in tags.items():
+            if value is True or merged.get(key) is True:
+                merged[key] = True
+                continue
+            values = merged.setdefault(key, [])
+            for v in [value] if isinstance(value, str) else value:
+                if v not in values:
+                    values.append(v)
+    return merged
+
+
+def tag_mask(gdf: GeoDataFrame, tags: dict):
+    """Rows of gdf matching any of the OSM tag filter's key/value pairs."""
+    mask = None
+    for key, value in tags.items():
+        if key not in gdf.columns:
+            continue
+        column = gdf[key]
+        if value is True:
+            match = column.notna()
+        elif isinstance(value, str):
+            match = column == value
+        else:
+            match = column.isin(value)
+        mask = match if mask is None else mask | match
+    return mask
+
+
+def fetch_tag_groups(point, dist, groups: dict[str, dict]) -> dict[str, GeoDataFrame | None]:
+    """
+    Fetch several tag groups with a single Overpass query and split the
+    result per group. Groups with no matching features map to None, as
+    they would if queried on their own.
+    """
+    features = features_from_point(point, tags=merge_tags(groups), dist=dist)
+
+    result = {}
+    for name, tags in groups.items():
+        mask = tag_mask(features, tags)
+        subset = features[mask] if mask is not None else features.iloc[:0]
+        result[name] = subset if not subset.empty else None
+    return result
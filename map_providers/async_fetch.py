@@ -0,0 +1,86 @@
+"""
+Concurrent OpenStreetMap fetching across map providers.
+
+osmnx is synchronous, so each fetch runs in a worker thread through
+asyncio.to_thread. A semaphore keeps at most OVERPASS_SLOTS requests in
+flight, the number of concurrent slots the Overpass API grants a client.
+Fetching every provider this way costs roughly the slowest fetch rather
+than the sum of all of them.
+"""
+
+import asyncio
+from typing import Any, Callable
+
+from map_providers.aviation import fetch_aviation_features
+from map_providers.cycling import fetch_cycling_routes
+from map_providers.maritime import fetch_maritime_features
+from map_providers.railway import fetch_railway_all
+
+__all__ = [
+    "OVERPASS_SLOTS",
+    "PROVIDER_FETCHERS",
+    "fetch_all_providers",
+    "fetch_concurrently",
+    "gather_fetches",
+]
+
+OVERPASS_SLOTS = 2
+
+# Provider name -> fetch(point, dist, target_crs)
+PROVIDER_FETCHERS: dict[str, Callable[..., Any]] = {
+    "aviation": fetch_aviation_features,
+    "cycling": lambda point, dist, target_crs=None: fetch_cycling_routes(point, dist),
+    "maritime": fetch_maritime_features,
+    "railway": lambda point, dist, target_crs=None: fetch_railway_all(point, dist),
+}
+
+
+async def gather_fetches(calls: dict[str, Callable[[], Any]]) -> dict[str, Any]:
+    """
+    Run fetch callables concurrently, at most OVERPASS_SLOTS at a time.
+
+    Returns:
+        Dict of name -> result; a call that raised maps to its exception
+    """
+    slots = asyncio.Semaphore(OVERPASS_SLOTS)
+
+    async def run(func):
+        async with slots:
+            return await asyncio.to_thread(func)
+
+    results = await asyncio.gather(
+        *(run(func) for func in calls.values()), return_exceptions=True
+    )
+    return dict(zip(calls, results))
+
+
+def fetch_concurrently(calls: dict[str, Callable[[], Any]]) -> dict[str, Any]:
+    """Blocking gather_fetches for synchronous callers."""
+    return asyncio.run(gather_fetches(calls))
+
+
+async def fetch_all_providers(
+    point, dist, providers=None, target_crs=None
+) -> dict[str, Any]:
+    """
+    Fetch several providers' features in one gather.
+
+    Args:
+        point: (lat, lon)
+        dist: Radius in meters
+        providers: Names from PROVIDER_FETCHERS (default: all of them)
+        target_crs: CRS to reproject into, for providers that support it
+
+    Returns:
+        Dict of provider name -> that provider's usual fetch result
+    """
+    names = providers if providers is not None else list(PROVIDER_FETCHERS)
+    calls = {
+        name: (
+            lambda fetch=PROVIDER_FETCHERS[name]: fetch(
+                point, dist, target_crs=target_crs
+            )
+        )
+        for name in names
+    }
+    return await gather_fetches(calls)
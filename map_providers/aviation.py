@@ -3,64 +3,62 @@ Aviation map provider for airports, flight paths, and airways.
 Uses OpenStreetMap data for aviation features.
 """
 
-import time
-from typing import cast
+from __future__ import annotations
 
-import osmnx as ox
-from geopandas import GeoDataFrame
+from typing import TYPE_CHECKING, cast
 
 from logging_config import logger
+from map_providers._features import fetch_tag_groups
 
+if TYPE_CHECKING:
+    from geopandas import GeoDataFrame
 
-def fetch_aviation_features(point, dist) -> tuple[GeoDataFrame | None, GeoDataFrame | None, GeoDataFrame | None]:
+__all__ = ["fetch_aviation_features", "get_aviation_color_scheme"]
+
+
+def fetch_aviation_features(point, dist, target_crs=None) -> tuple[GeoDataFrame | None, GeoDataFrame | None, GeoDataFrame | None]:
     """
     Fetch aviation features from OpenStreetMap.
     
+    If target_crs is given, results are reprojected into it before returning.
+
     Returns:
         (airports, runways, airways)
     """
-    lat, lon = point
-    
-    # Airports and airfields
-    airports = None
+    # Airports, runways and navigation aids come from one Overpass query
+    airports = runways = airways = None
     try:
-        airport_tags = {
-            "aeroway": ["aerodrome", "airport", "helipad"],
-            "amenity": "airport"
-        }
-        airports = ox.features_from_point(point, tags=airport_tags, dist=dist)
-        time.sleep(0.3)
+        groups = fetch_tag_groups(point, dist, {
+            # Airports and airfields
+            "airports": {
+                "aeroway": ["aerodrome", "airport", "helipad"],
+                "amenity": "airport",
+            },
+            # Runways and taxiways
+            "runways": {"aeroway": ["runway", "taxiway", "apron", "hangar"]},
+            # Airways are typically not mapped in OSM, but we can look for
+            # navigation aids
+            "airways": {
+                "aeroway": ["navigationaid", "beacon", "ils"],
+                "man_made": "beacon",
+            },
+        })
+        airports, runways, airways = (
+            groups["airports"], groups["runways"], groups["airways"]
+        )
     except Exception as e:
-        logger.warning(f"Could not fetch airports: {e}")
-    
-    # Runways and taxiways
-    runways = None
-    try:
-        runway_tags = {
-            "aeroway": ["runway", "taxiway", "apron", "hangar"]
-        }
-        runways = ox.features_from_point(point, tags=runway_tags, dist=dist)
-        time.sleep(0.3)
-    except Exception as e:
-        logger.warning(f"Could not fetch runways: {e}")
-    
-    # Airways (simplified - typically not in OSM, but we can get air corridors)
-    airways = None
-    try:
-        # Airways are typically not mapped in OSM, but we can look for navigation aids
-        airway_tags = {
-            "aeroway": ["navigationaid", "beacon", "ils"],
-            "man_made": "beacon"
-        }
-        airways = ox.features_from_point(point, tags=airway_tags, dist=dist)
-        time.sleep(0.3)
-    except Exception as e:
-        logger.warning(f"Could not fetch airways: {e}")
+        logger.warning(f"Could not fetch aviation features: {e}")
     
+    if target_crs is not None:
+        airports, runways, airways = (
+            gdf.to_crs(target_crs) if gdf is not None and not gdf.empty else gdf
+            for gdf in (airports, runways, airways)
+        )
+
     return (
-        cast(GeoDataFrame, airports) if airports is not None else None,
-        cast(GeoDataFrame, runways) if runways is not None else None,
-        cast(GeoDataFrame, airways) if airways is not None else None
+        cast("GeoDataFrame", airports) if airports is not None else None,
+        cast("GeoDataFrame", runways) if runways is not None else None,
+        cast("GeoDataFrame", airways) if airways is not None else None
     )
 
 
@@ -1,12 +1,15 @@
 """Cycling route map data fetching using CyclOSM/OpenStreetMap data."""
-import osmnx as ox
-import time
 from typing import Optional
 
-try:
-    from geopandas import GeoDataFrame
-except ImportError:
-    GeoDataFrame = None
+from map_providers._cache import features_from_point
+
+__all__ = [
+    "CYCLE_TAGS",
+    "fetch_bike_shops",
+    "fetch_cycling_routes",
+    "get_cycling_colors",
+    "get_cycling_line_color",
+]
 
 # OSM tags for cycling infrastructure
 CYCLE_TAGS = {
@@ -19,21 +22,21 @@ def fetch_cycling_routes(point, dist) -> Optional[object]:
     """Fetch cycling routes from OpenStreetMap."""
     try:
         # Fetch cycleways
-        cycleways = ox.features_from_point(
+        cycleways = features_from_point(
             point, tags={"highway": "cycleway"}, dist=dist
         )
-        time.sleep(0.3)
-        
+
         # Fetch bicycle-designated roads
-        bike_roads = ox.features_from_point(
+        bike_roads = features_from_point(
             point, tags={"bicycle": "designated"}, dist=dist
         )
-        time.sleep(0.3)
-        
-        # Combine if both exist
+
+        # Combine if both exist (GeoDataFrame.append is gone in pandas 2)
         if cycleways is not None and bike_roads is not None:
-            return cycleways.append(bike_roads)
-        return cycleways or bike_roads
+            import pandas as pd
+
+            return pd.concat([cycleways, bike_roads], ignore_index=True)
+        return cycleways if cycleways is not None else bike_roads
     except Exception as e:
         print(f"[!] Error fetching cycling data: {e}")
         return None
@@ -41,10 +44,9 @@ def fetch_cycling_routes(point, dist) -> Optional[object]:
 def fetch_bike_shops(point, dist) -> Optional[object]:
     """Fetch bike shops and repair stations."""
     try:
-        shops = ox.features_from_point(
+        shops = features_from_point(
             point, tags={"shop": "bicycle"}, dist=dist
         )
-        time.sleep(0.3)
         return shops
     except Exception as e:
         return None
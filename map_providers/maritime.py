@@ -1,76 +1,78 @@
 """Maritime map provider for nautical charts and shipping lanes."""
 
-import time
-from typing import cast
+from __future__ import annotations
 
-import osmnx as ox
-from geopandas import GeoDataFrame
+from typing import TYPE_CHECKING, cast
 
 from logging_config import logger
+from map_providers._cache import features_from_point
+from map_providers._features import fetch_tag_groups
 
+if TYPE_CHECKING:
+    from geopandas import GeoDataFrame
 
-def fetch_maritime_features(point, dist) -> tuple[GeoDataFrame | None, GeoDataFrame | None, GeoDataFrame | None]:
+__all__ = ["fetch_coastline", "fetch_maritime_features"]
+
+
+def fetch_maritime_features(point, dist, target_crs=None) -> tuple[GeoDataFrame | None, GeoDataFrame | None, GeoDataFrame | None]:
     """
     Fetch maritime features from OpenStreetMap.
     
+    If target_crs is given, results are reprojected into it before returning.
+
     Returns:
         (water_features, harbors, seamarks)
     """
-    lat, lon = point
-    
-    # Water features (sea, ocean, large lakes)
-    water = None
+    # Water, harbors and seamarks come from one Overpass query
+    water = harbors = seamarks = None
     try:
-        water_tags = {
-            "natural": ["water", "coastline"],
-            "waterway": ["riverbank"],
-            "place": ["sea", "ocean"]
-        }
-        water = ox.features_from_point(point, tags=water_tags, dist=dist)
-        time.sleep(0.3)
+        groups = fetch_tag_groups(point, dist, {
+            # Water features (sea, ocean, large lakes)
+            "water": {
+                "natural": ["water", "coastline"],
+                "waterway": ["riverbank"],
+                "place": ["sea", "ocean"],
+            },
+            # Harbors and ports
+            "harbors": {
+                "harbour": "yes",
+                "man_made": ["pier", "breakwater", "groyne"],
+                "amenity": ["ferry_terminal", "port"],
+            },
+            # Seamarks and navigation aids
+            "seamarks": {
+                "seamark:type": True,  # Any seamark
+                "man_made": ["lighthouse", "beacon"],
+                "buoy": True,
+            },
+        })
+        water, harbors, seamarks = (
+            groups["water"], groups["harbors"], groups["seamarks"]
+        )
     except Exception as e:
-        logger.warning(f"Could not fetch water features: {e}")
-    
-    # Harbors and ports
-    harbors = None
-    try:
-        harbor_tags = {
-            "harbour": "yes",
-            "man_made": ["pier", "breakwater", "groyne"],
-            "amenity": ["ferry_terminal", "port"]
-        }
-        harbors = ox.features_from_point(point, tags=harbor_tags, dist=dist)
-        time.sleep(0.3)
-    except Exception as e:
-        logger.warning(f"Could not fetch harbor features: {e}")
-    
-    # Seamarks and navigation aids
-    seamarks = None
-    try:
-        seamark_tags = {
-            "seamark:type": True,  # Any seamark
-            "man_made": ["lighthouse", "beacon"],
-            "buoy": True
-        }
-        seamarks = ox.features_from_point(point, tags=seamark_tags, dist=dist)
-        time.sleep(0.3)
-    except Exception as e:
-        logger.warning(f"Could not fetch seamark features: {e}")
+        logger.warning(f"Could not fetch maritime features: {e}")
     
+    if target_crs is not None:
+        water, harbors, seamarks = (
+            gdf.to_crs(target_crs) if gdf is not None and not gdf.empty else gdf
+            for gdf in (water, harbors, seamarks)
+        )
+
     return (
-        cast(GeoDataFrame, water) if water is not None else None,
-        cast(GeoDataFrame, harbors) if harbors is not None else None,
-        cast(GeoDataFrame, seamarks) if seamarks is not None else None
+        cast("GeoDataFrame", water) if water is not None else None,
+        cast("GeoDataFrame", harbors) if harbors is not None else None,
+        cast("GeoDataFrame", seamarks) if seamarks is not None else None
     )
 
 
-def fetch_coastline(point, dist) -> GeoDataFrame | None:
-    """Fetch coastline data for maritime maps."""
+def fetch_coastline(point, dist, target_crs=None) -> GeoDataFrame | None:
+    """Fetch coastline data for maritime maps, optionally reprojected to target_crs."""
     try:
         coastline_tags = {"natural": "coastline"}
-        coastline = ox.features_from_point(point, tags=coastline_tags, dist=dist)
-        time.sleep(0.3)
-        return cast(GeoDataFrame, coastline) if coastline is not None else None
+        coastline = features_from_point(point, tags=coastline_tags, dist=dist)
+        if target_crs is not None and coastline is not None and not coastline.empty:
+            coastline = coastline.to_crs(target_crs)
+        return cast("GeoDataFrame", coastline) if coastline is not None else None
     except Exception as e:
         logger.warning(f"Could not fetch coastline: {e}")
         return None
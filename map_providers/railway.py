@@ -1,13 +1,19 @@
 """Railway map data fetching and rendering using OpenStreetMap data."""
 
-import osmnx as ox
-import time
 from typing import Optional
 
-try:
-    from geopandas import GeoDataFrame
-except ImportError:
-    GeoDataFrame = None
+from map_providers._features import fetch_tag_groups
+
+__all__ = [
+    "RAILWAY_TAGS",
+    "STATION_TAGS",
+    "fetch_railway_all",
+    "fetch_railway_network",
+    "fetch_railway_stations",
+    "get_railway_colors",
+    "get_railway_line_color",
+    "get_railway_line_width",
+]
 
 RAILWAY_TAGS = {
     "railway": [
@@ -23,31 +29,26 @@ RAILWAY_TAGS = {
 STATION_TAGS = {"railway": ["station", "halt", "tram_stop"]}
 
 
-def fetch_railway_network(point, dist) -> Optional[object]:
-    """Fetch railway network from OpenStreetMap."""
+def fetch_railway_all(point, dist) -> tuple[Optional[object], Optional[object]]:
+    """Fetch railway lines and stations with a single OpenStreetMap query."""
     try:
-        # Fetch railway lines
-        railways = ox.features_from_point(
-            point, tags={"railway": RAILWAY_TAGS["railway"]}, dist=dist
+        groups = fetch_tag_groups(
+            point, dist, {"lines": RAILWAY_TAGS, "stations": STATION_TAGS}
         )
-        time.sleep(0.3)  # Rate limiting
-        return railways
+        return groups["lines"], groups["stations"]
     except Exception as e:
         print(f"[!] Error fetching railway data: {e}")
-        return None
+        return None, None
+
+
+def fetch_railway_network(point, dist) -> Optional[object]:
+    """Fetch railway network from OpenStreetMap."""
+    return fetch_railway_all(point, dist)[0]
 
 
 def fetch_railway_stations(point, dist) -> Optional[object]:
     """Fetch railway stations from OpenStreetMap."""
-    try:
-        stations = ox.features_from_point(
-            point, tags={"railway": STATION_TAGS["railway"]}, dist=dist
-        )
-        time.sleep(0.3)
-        return stations
-    except Exception as e:
-        print(f"[!] Error fetching station data: {e}")
-        return None
+    return fetch_railway_all(point, dist)[1]
 
 
 def get_railway_colors():
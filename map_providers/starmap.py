@@ -3,9 +3,19 @@ Star map provider for generating 2D constellation charts.
 Uses astronomical calculations to render night sky from any location/date.
 """
 
+import functools
+import math
+import threading
 import numpy as np
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Optional, Tuple, List
+from types import MappingProxyType
+from typing import Mapping, Optional, Tuple
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
 
 # Simplified bright star catalog (name, RA, Dec, magnitude)
 # RA in hours (0-24), Dec in degrees (-90 to +90)
@@ -54,6 +64,52 @@ BRIGHT_STARS = [
     ("Peacock", 20.43, -56.7, 1.94),
 ]
 
+_DEG2RAD = math.pi / 180.0
+# Hours of right ascension or hour angle to radians (15 degrees per hour)
+_HOUR2RAD = 15 * _DEG2RAD
+
+# Stars must be at least 10 degrees above the horizon. sin is monotonic over
+# altitudes, so comparing sin(alt) needs no arcsin for stars below it.
+_SIN_10DEG = math.sin(10 * _DEG2RAD)
+
+# Catalog columns as arrays, so positions are computed for every star at once.
+# BRIGHT_STARS stays the public catalog; all computation reads these columns.
+_NAMES = np.array([star[0] for star in BRIGHT_STARS], dtype=object)
+_RA = np.fromiter((star[1] for star in BRIGHT_STARS), dtype=np.float64, count=len(BRIGHT_STARS))
+_DEC = np.fromiter((star[2] for star in BRIGHT_STARS), dtype=np.float64, count=len(BRIGHT_STARS))
+_MAG = np.fromiter((star[3] for star in BRIGHT_STARS), dtype=np.float64, count=len(BRIGHT_STARS))
+_DEC_RAD = _DEC * _DEG2RAD
+_SIN_DEC = np.sin(_DEC_RAD)
+_COS_DEC = np.cos(_DEC_RAD)
+
+if njit is not None:
+
+    @njit(cache=True, fastmath=True)
+    def _star_positions_kernel(lst, sin_lat, cos_lat, ra, sin_dec, cos_dec,
+                               out_x, out_y, out_sin_alt):
+        """
+        Per-star loop of calculate_star_positions: sin(altitude) of every
+        catalog star, and projected x/y of those above _SIN_10DEG, written
+        into the out arrays.
+        """
+        for i in range(ra.shape[0]):
+            ha = (lst - ra[i]) * _HOUR2RAD
+            cos_ha = math.cos(ha)
+            sin_alt = sin_dec[i] * sin_lat + cos_dec[i] * cos_lat * cos_ha
+            out_sin_alt[i] = sin_alt
+            if sin_alt <= _SIN_10DEG:
+                continue
+            alt = math.asin(sin_alt)
+            az = math.atan2(
+                math.sin(ha) * cos_dec[i],
+                cos_ha * sin_lat * cos_dec[i] - sin_dec[i] * cos_lat,
+            )
+            out_x[i] = ((az / math.tau) % 1 * 2 - 1) * math.cos(alt)
+            out_y[i] = alt * (2 / math.pi) * math.sin(az)
+
+else:
+    _star_positions_kernel = None
+
 # Simplified constellation stick figures (indices into BRIGHT_STARS)
 CONSTELLATIONS = {
     "Orion": [(26, 25), (25, 27), (27, 8)],  # Bellatrix-Betelgeuse-Alnilam
@@ -63,8 +119,86 @@ CONSTELLATIONS = {
     "Centaurus": [(4, 10)],  # Rigil-Hadar
 }
 
+# All stick-figure segments as an (N, 2) index array, shared read-only
+_CONSTELLATION_LINES = np.array(
+    [pair for pairs in CONSTELLATIONS.values() for pair in pairs], dtype=np.int32
+)
+_CONSTELLATION_LINES.setflags(write=False)
+
+
+@functools.lru_cache(maxsize=64)
+def _base_lst(year: int, month: int, day: int, hour: int, minute: int, second: int) -> float:
+    """
+    Sidereal time at longitude 0, before wrapping to 24 h.
+
+    Depends only on the date and time, so redraws that move the observer
+    but keep the date reuse the Julian date calculation.
+    """
+    # Julian date calculation (simplified)
+    if month <= 2:
+        year -= 1
+        month += 12
+    A = int(year / 100)
+    B = 2 - A + int(A / 4)
+    JD = int(365.25 * (year + 4716)) + int(30.6001 * (month + 1)) + day + B - 1524.5
+
+    hours = hour + minute / 60 + second / 3600
+    return (JD - 2451545.0) * 0.00273791 + hours
+
+
+@dataclass(slots=True)
+class _ScratchBuffers:
+    """Per-star float64 work arrays reused across calculate_star_positions calls."""
+    ha_rad: np.ndarray
+    cos_ha: np.ndarray
+    sin_alt: np.ndarray
+    up: np.ndarray
+    alt_rad: np.ndarray
+    az_rad: np.ndarray
+    x: np.ndarray
+    y: np.ndarray
+    tmp: np.ndarray
+
+    @classmethod
+    def alloc(cls, n: int) -> "_ScratchBuffers":
+        return cls(
+            ha_rad=np.empty(n),
+            cos_ha=np.empty(n),
+            sin_alt=np.empty(n),
+            up=np.empty(n, dtype=bool),
+            alt_rad=np.empty(n),
+            az_rad=np.empty(n),
+            x=np.empty(n),
+            y=np.empty(n),
+            tmp=np.empty(n),
+        )
+
+
+# One set of buffers per thread, so concurrent callers never share one
+_scratch = threading.local()
+
+
+def _scratch_buffers() -> _ScratchBuffers:
+    buffers = getattr(_scratch, "buffers", None)
+    if buffers is None:
+        buffers = _scratch.buffers = _ScratchBuffers.alloc(len(BRIGHT_STARS))
+    return buffers
+
 
-def calculate_star_positions(lat: float, lon: float, date: Optional[datetime] = None) -> List[Tuple[str, float, float, float]]:
+def _visible_stars(idx, x, y, gathered=False):
+    """
+    Pack the columns of the stars at catalog indices idx; x and y may
+    already be gathered.
+    """
+    xy = np.empty((len(idx), 2), dtype=np.float32)
+    xy[:, 0] = x if gathered else x[idx]
+    xy[:, 1] = y if gathered else y[idx]
+    return _NAMES[idx], xy, _MAG[idx].astype(np.float32)
+
+
+def calculate_star_positions(
+    lat: float, lon: float, date: Optional[datetime] = None
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
     """
     Calculate visible star positions from a given location.
     
@@ -74,82 +208,98 @@ def calculate_star_positions(lat: float, lon: float, date: Optional[datetime] =
         date: Date/time for calculation (default: now)
         
     Returns:
-        List of (name, x, y, magnitude) for visible stars
+        (names, xy, magnitudes) for the visible stars: an object array of
+        names, an (N, 2) float32 array of x/y and a float32 array of
+        magnitudes
     """
     if date is None:
         date = datetime.now()
     
-    # Julian date calculation (simplified)
-    year, month, day = date.year, date.month, date.day
-    if month <= 2:
-        year -= 1
-        month += 12
-    A = int(year / 100)
-    B = 2 - A + int(A / 4)
-    JD = int(365.25 * (year + 4716)) + int(30.6001 * (month + 1)) + day + B - 1524.5
-    
     # Local sidereal time (simplified)
-    hours = date.hour + date.minute / 60 + date.second / 3600
-    LST = (JD - 2451545.0) * 0.00273791 + hours + lon / 15
+    LST = _base_lst(date.year, date.month, date.day, date.hour, date.minute, date.second) + lon / 15
     LST = LST % 24
     
-    visible_stars = []
-    
-    for name, ra, dec, mag in BRIGHT_STARS:
-        # Hour angle
-        HA = (LST - ra) % 24
-        HA_rad = np.radians(HA * 15)
-        dec_rad = np.radians(dec)
-        lat_rad = np.radians(lat)
-        
-        # Altitude calculation
-        sin_alt = np.sin(dec_rad) * np.sin(lat_rad) + np.cos(dec_rad) * np.cos(lat_rad) * np.cos(HA_rad)
-        alt = np.degrees(np.arcsin(sin_alt))
-        
-        # Azimuth calculation
-        y = np.sin(HA_rad)
-        x = np.cos(HA_rad) * np.sin(lat_rad) - np.tan(dec_rad) * np.cos(lat_rad)
-        az = np.degrees(np.arctan2(y, x)) % 360
-        
-        # Only include stars above horizon
-        if alt > 10:  # At least 10 degrees above horizon
-            # Convert to stereographic projection (simplified)
-            # x = azimuth (0-360 mapped to -1 to 1)
-            # y = altitude (0-90 mapped to 0 to 1)
-            x = ((az / 360) * 2 - 1) * np.cos(np.radians(alt))
-            y = (alt / 90) * np.sin(np.radians(az))
-            visible_stars.append((name, x, y, mag))
-    
-    return visible_stars
+    # Scalar terms use math; NumPy ufuncs on Python floats are ~10x slower.
+    # The observer's latitude terms are the same for every star.
+    lat_rad = lat * _DEG2RAD
+    sin_lat = math.sin(lat_rad)
+    cos_lat = math.cos(lat_rad)
+
+    # Intermediates go into reused buffers (out=) rather than new arrays;
+    # only the returned arrays are allocated
+    s = _scratch_buffers()
+
+    if _star_positions_kernel is not None:
+        _star_positions_kernel(LST, sin_lat, cos_lat, _RA, _SIN_DEC, _COS_DEC, s.x, s.y, s.sin_alt)
+        np.greater(s.sin_alt, _SIN_10DEG, out=s.up)
+        return _visible_stars(np.flatnonzero(s.up), s.x, s.y)
+
+    # Hour angle of every star; sin and cos are periodic, so it is not wrapped
+    HA_rad = np.subtract(LST, _RA, out=s.ha_rad)
+    HA_rad *= _HOUR2RAD
+
+    # Altitude calculation; only stars at least 10 degrees above horizon
+    cos_HA = np.cos(HA_rad, out=s.cos_ha)
+    sin_alt = np.multiply(_COS_DEC, cos_lat, out=s.sin_alt)
+    sin_alt *= cos_HA
+    sin_alt += np.multiply(_SIN_DEC, sin_lat, out=s.tmp)
+    idx = np.flatnonzero(np.greater(sin_alt, _SIN_10DEG, out=s.up))
+    n = len(idx)
+    alt = np.take(sin_alt, idx, out=s.alt_rad[:n])
+    np.arcsin(alt, out=alt)
 
+    # Azimuth calculation; both terms are scaled by cos(dec) > 0 to avoid
+    # tan(dec), which leaves the atan2 angle unchanged
+    y = np.sin(HA_rad, out=s.y)
+    y *= _COS_DEC
+    x = np.multiply(cos_HA, sin_lat, out=s.x)
+    x *= _COS_DEC
+    x -= np.multiply(_SIN_DEC, cos_lat, out=s.tmp)
+    az = np.arctan2(
+        np.take(y, idx, out=s.az_rad[:n]), np.take(x, idx, out=s.tmp[:n]), out=s.az_rad[:n]
+    )
 
-def get_star_color_scheme() -> dict:
+    # Convert to stereographic projection (simplified), angles in radians
+    # x = azimuth (0-2pi mapped to -1 to 1)
+    # y = altitude (0-pi/2 mapped to 0 to 1)
+    x = np.divide(az, math.tau, out=s.x[:n])
+    np.remainder(x, 1, out=x)
+    x *= 2
+    x -= 1
+    x *= np.cos(alt, out=s.tmp[:n])
+    y = np.multiply(alt, 2 / math.pi, out=s.y[:n])
+    y *= np.sin(az, out=s.tmp[:n])
+
+    return _visible_stars(idx, x, y, gathered=True)
+
+
+_STAR_COLORS = MappingProxyType({
+    "bg": "#0a0a1a",           # Deep navy/black sky
+    "star": "#FFFFFF",          # White stars
+    "star_bright": "#FFF8DC",   # Cornsilk for bright stars
+    "constellation": "#4169E1", # Royal blue lines
+    "grid": "#1a1a2e",          # Subtle grid
+    "text": "#E0E0E0",          # Light gray text
+    "label": "#87CEEB",         # Sky blue labels
+})
+
+
+def get_star_color_scheme() -> Mapping[str, str]:
     """
     Get color scheme optimized for star maps.
     
     Returns:
-        dict with color values for star map features
+        Read-only mapping of color values for star map features
+        (copy with dict() to modify)
     """
-    return {
-        "bg": "#0a0a1a",           # Deep navy/black sky
-        "star": "#FFFFFF",          # White stars
-        "star_bright": "#FFF8DC",   # Cornsilk for bright stars
-        "constellation": "#4169E1", # Royal blue lines
-        "grid": "#1a1a2e",          # Subtle grid
-        "text": "#E0E0E0",          # Light gray text
-        "label": "#87CEEB",         # Sky blue labels
-    }
-
-
-def get_constellation_lines() -> List[Tuple[int, int]]:
+    return _STAR_COLORS
+
+
+def get_constellation_lines() -> np.ndarray:
     """
     Get constellation line indices.
     
     Returns:
-        List of (star1_index, star2_index) tuples
+        Read-only (N, 2) int32 array of (star1_index, star2_index) rows
     """
-    lines = []
-    for constellation, star_pairs in CONSTELLATIONS.items():
-        for pair in star_pairs:
-            lines.append(pair)
-    return lines
+    return _CONSTELLATION_LINES
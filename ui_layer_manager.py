@@ -4,29 +4,37 @@ UI Layer Manager Module
 Electron IPC handlers and UI components for managing map layers.
 """
 
+from types import MappingProxyType
+
 from map_layer_compositor import BlendMode, LayerCompositor
 
-LAYER_TYPE_ICONS = {
+# Read-only lookups; the *_ITEMS tuples are ready-made (key, label) options
+# for the UI's dropdowns
+LAYER_TYPE_ICONS = MappingProxyType({
     'city': '🏙️',
     'railway': '🚂',
     'cycling': '🚴',
     'transit': '🚌',
     'maritime': '⚓',
-}
+})
 
-BLEND_MODE_LABELS = {
+BLEND_MODE_LABELS = MappingProxyType({
     'normal': 'Normal',
     'multiply': 'Multiply (Darken)',
     'screen': 'Screen (Lighten)',
     'overlay': 'Overlay (Contrast)',
     'soft_light': 'Soft Light',
     'hard_light': 'Hard Light',
-}
+})
 
-PRESETS = {
+PRESETS = MappingProxyType({
     'city_railway_overlay': 'City + Railways',
     'cycling_highlight': 'Cycling Routes',
     'transit_focus': 'Public Transit',
     'coastal_city': 'Coastal/Maritime',
     'triple_transit': 'All Transit Layers',
-}
+})
+
+LAYER_TYPE_ICON_ITEMS = tuple(LAYER_TYPE_ICONS.items())
+BLEND_MODE_LABEL_ITEMS = tuple(BLEND_MODE_LABELS.items())
+PRESET_ITEMS = tuple(PRESETS.items())